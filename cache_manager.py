@@ -6,9 +6,11 @@ Supports both local filesystem and AWS S3 transport layers.
 """
 
 import argparse
+import io
 import sys
 import os
 import time
+import statistics
 from pathlib import Path
 from datetime import datetime
 from dotenv import load_dotenv
@@ -24,6 +26,9 @@ from src.transport_factory import create_cache_transport, create_optimization_tr
 CACHE_TRANSPORT_TYPE = 'local'
 LOG_TRANSPORT_TYPE = 'local'
 
+# Timed cached fetches in the performance test, after one untimed warm-up fetch
+CACHE_BENCHMARK_RUNS = 5
+
 def show_cache_info():
     """Display detailed cache information"""
     print("="*60)
@@ -55,6 +60,8 @@ def show_cache_info():
             print(f"{'Key':<30} {'Size (KB)':<10} {'Age (hours)':<12} {'Symbol':<12} {'Timeframe':<10} {'Provider'}")
             print("-" * 80)
             
+            # One row per cached file: build the table in memory and write it once
+            buf = io.StringIO()
             for file_info in sorted(cache_info['files'], key=lambda x: x['age_hours']):
                 metadata = file_info.get('metadata', {})
                 
@@ -67,7 +74,8 @@ def show_cache_info():
                       f"{file_info['age_hours']:<12.1f} "
                       f"{symbol:<12} "
                       f"{timeframe:<10} "
-                      f"{provider}")
+                      f"{provider}", file=buf)
+            sys.stdout.write(buf.getvalue())
         else:
             print("No cached files found.")
     
@@ -186,27 +194,33 @@ def test_cache_performance():
     
     # Test with cache
     print("🔄 Fetching with cache enabled...")
-    start_time = time.time()
     
     try:
         # Create cache transport with specified type
         cache_transport = create_cache_transport(transport_type=CACHE_TRANSPORT_TYPE)
         fetcher = DataFetcher(source=source, symbol=symbol, timeframe=timeframe, 
                             use_cache=True, cache_transport=cache_transport)
+        
+        # Warm-up fetch fills the cache (and pays any API call), so it is not timed
         df = fetcher.fetch(years=years)
-        cached_time = time.time() - start_time
+        cached_times = []
+        for _ in range(CACHE_BENCHMARK_RUNS):
+            start_ns = time.perf_counter_ns()
+            fetcher.fetch(years=years)
+            cached_times.append((time.perf_counter_ns() - start_ns) / 1e9)
+        cached_time = statistics.median(cached_times)
         
-        print(f"✅ Completed in {cached_time:.2f} seconds")
+        print(f"✅ Completed in {cached_time * 1000:.1f} ms (median of {CACHE_BENCHMARK_RUNS} cached fetches)")
         print(f"   Data shape: {df.shape}")
         print()
         
         # Test without cache
         print("🔄 Fetching without cache...")
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         fetcher_no_cache = DataFetcher(source=source, symbol=symbol, timeframe=timeframe, use_cache=False)
         df_no_cache = fetcher_no_cache.fetch(years=years)
-        no_cache_time = time.time() - start_time
+        no_cache_time = (time.perf_counter_ns() - start_ns) / 1e9
         
         print(f"✅ Completed in {no_cache_time:.2f} seconds")
         print()
@@ -216,7 +230,7 @@ def test_cache_performance():
             speedup = no_cache_time / cached_time
             print(f"🚀 Cache is {speedup:.1f}x faster!")
         else:
-            print("📦 No significant performance difference (cache miss)")
+            print("📦 No significant performance difference")
             
     except Exception as e:
         print(f"❌ Error during test: {e}")
@@ -231,8 +231,8 @@ class PerformanceAnalyzer:
             )
 
             # Extract real performance data from backtest results
-            initial_balance = equity_curve[0] if equity_curve else 100000.0
-            final_balance = equity_curve[-1] if equity_curve else 100000.0
+            initial_balance = equity_curve[0] if len(equity_curve) > 0 else 100000.0
+            final_balance = equity_curve[-1] if len(equity_curve) > 0 else 100000.0
             total_pnl = final_balance - initial_balance
 
             # Calculate max drawdown from equity curve
@@ -291,7 +291,7 @@ class PerformanceAnalyzer:
                 'signals': order_log,  # All orders placed (signals)
                 'final_balance': final_balance,
                 'total_trades': len(completed_trades),
-                'equity_curve': equity_curve,
+                'equity_curve': list(map(float, equity_curve)),  # JSON-friendly floats
                 'equity_dates': equity_dates,
                 'data': data  # Store data for visualization
             }
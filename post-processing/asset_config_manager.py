@@ -264,27 +264,37 @@ class AssetConfigManager:
                 logger.error("Could not import StrategyConfig module")
                 return False
         
-        # Update global configuration using the correct attribute names
+        # Update global configuration using the correct attribute names.
+        # Sections are read-only, so go through update_config() which also
+        # invalidates the cached backtrader params.
         try:
-            # Update Bollinger Bands
-            strategy_config_module.BOLLINGER_BANDS['window'] = config.bb_window
-            strategy_config_module.BOLLINGER_BANDS['std_dev'] = config.bb_std
-            
-            # Update VWAP (note: it's VWAP not VWAP_BANDS in the actual config)
-            strategy_config_module.VWAP['window'] = config.vwap_window
-            strategy_config_module.VWAP['std_dev'] = config.vwap_std
-            
-            # Update Risk Management
-            strategy_config_module.RISK_MANAGEMENT['risk_per_position_pct'] = config.risk_per_position_pct
-            strategy_config_module.RISK_MANAGEMENT['stop_loss_atr_multiplier'] = config.stop_loss_atr_multiplier
-            strategy_config_module.RISK_MANAGEMENT['risk_reward_ratio'] = config.risk_reward_ratio
-            strategy_config_module.RISK_MANAGEMENT['atr_period'] = config.atr_period
-            
-            # Update Entry Conditions (note: attribute name mapping)
-            strategy_config_module.ENTRY_CONDITIONS['require_reversal_confirmation'] = config.require_reversal
-            
-            # Update Market Regime
-            strategy_config_module.MARKET_REGIME['min_regime_score'] = config.regime_min_score
+            strategy_config_module.update_config(
+                # Bollinger Bands
+                bollinger_bands={
+                    'window': config.bb_window,
+                    'std_dev': config.bb_std
+                },
+                # VWAP (note: it's VWAP not VWAP_BANDS in the actual config)
+                vwap={
+                    'window': config.vwap_window,
+                    'std_dev': config.vwap_std
+                },
+                # Risk Management
+                risk_management={
+                    'risk_per_position_pct': config.risk_per_position_pct,
+                    'stop_loss_atr_multiplier': config.stop_loss_atr_multiplier,
+                    'risk_reward_ratio': config.risk_reward_ratio,
+                    'atr_period': config.atr_period
+                },
+                # Entry Conditions (note: attribute name mapping)
+                entry_conditions={
+                    'require_reversal_confirmation': config.require_reversal
+                },
+                # Market Regime
+                market_regime={
+                    'min_regime_score': config.regime_min_score
+                }
+            )
             
         except AttributeError as e:
             logger.error(f"Error updating strategy config: {e}")
@@ -149,7 +149,7 @@ def generate_visualizations(df, bb, vwap_dict, equity_curve, equity_dates, order
         plots_dir = os.path.join(os.path.dirname(__file__), 'plots')
         
         # Save equity curve plot
-        if equity_curve and len(equity_curve) > 1:
+        if len(equity_curve) > 1:
             equity_path = os.path.join(plots_dir, f'equity_curve_{timestamp}.png')
             plot_equity_curve(equity_curve, equity_dates, save_path=equity_path)
         else:
@@ -366,8 +366,8 @@ Examples:
             print(f"   Expected Trades: {expected_metrics['total_trades']}")
             print("-" * 60)
         
-        final_balance = equity_curve[-1] if equity_curve else 0
-        initial_balance = equity_curve[0] if equity_curve else 0
+        final_balance = equity_curve[-1] if len(equity_curve) > 0 else 0
+        initial_balance = equity_curve[0] if len(equity_curve) > 0 else 0
         actual_pnl = final_balance - initial_balance
         
         print(f"📈 ACTUAL Performance:")
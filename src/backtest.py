@@ -120,7 +120,8 @@ def run_backtest(data, strategy_class, params, leverage=100.0, verbose=True):
         equity_dates = getattr(strat, 'equity_dates', [])
         
         # If no equity curve was tracked by strategy, calculate it from order history
-        if not equity_curve:
+        # (the strategy exports a NumPy array, so check the length rather than truthiness)
+        if len(equity_curve) == 0:
             if verbose:
                 print("No equity curve found in strategy, calculating from broker state...")
             # Calculate portfolio value based on actual cash + unrealized P&L
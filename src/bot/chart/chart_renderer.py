@@ -82,7 +82,8 @@ class ChartRenderer:
                     additional_plots: List,
                     signal_data: Dict[str, Any],
                     symbol: str,
-                    has_rsi: bool = False) -> Optional[bytes]:
+                    has_rsi: bool = False,
+                    png_compress_level: int = 6) -> Optional[bytes]:
         """
         Render complete chart and return as PNG bytes
         
@@ -92,6 +93,7 @@ class ChartRenderer:
             signal_data: Signal information for title and levels
             symbol: Clean symbol name for display
             has_rsi: Whether RSI panel is present (affects layout)
+            png_compress_level: zlib level for PNG encoding (0-9, lower is faster)
             
         Returns:
             PNG chart as bytes or None if rendering fails
@@ -150,7 +152,7 @@ class ChartRenderer:
             self._add_timestamp(axes[0], theme)
             
             # Save to bytes buffer
-            chart_bytes = self._save_to_buffer(fig, theme)
+            chart_bytes = self._save_to_buffer(fig, theme, png_compress_level)
             
             # Clean up
             plt.close(fig)
@@ -289,13 +291,14 @@ class ChartRenderer:
             color=theme['text_color']
         )
     
-    def _save_to_buffer(self, fig, theme: Dict) -> bytes:
+    def _save_to_buffer(self, fig, theme: Dict, png_compress_level: int = 6) -> bytes:
         """
         Save chart figure to bytes buffer
         
         Args:
             fig: Matplotlib figure
             theme: Theme colors dictionary
+            png_compress_level: zlib level for PNG encoding (0-9)
             
         Returns:
             PNG image as bytes
@@ -307,7 +310,8 @@ class ChartRenderer:
             dpi=self.dpi,
             bbox_inches='tight',
             facecolor=theme['figure_color'],
-            edgecolor='none'
+            edgecolor='none',
+            pil_kwargs={'compress_level': png_compress_level}
         )
         buffer.seek(0)
         return buffer.getvalue()
@@ -14,10 +14,13 @@ This strategy aims to capture liquidity sweeps during the transition from Asia t
 import logging
 from datetime import datetime, timezone, time
 from typing import Dict, Optional, List, Tuple
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+_MINUTES_PER_DAY = 24 * 60
+
 
 class AsiaSessionSweepDetector:
     """
@@ -49,6 +52,10 @@ class AsiaSessionSweepDetector:
         self.signal_window_start = self._parse_time(signal_window_start)
         self.signal_window_end = self._parse_time(signal_window_end)
         
+        # Session bounds as minute-of-day for vectorized candle filtering
+        self._session_start_minute = self.session_start.hour * 60 + self.session_start.minute
+        self._session_end_minute = self.session_end.hour * 60 + self.session_end.minute
+        
         logger.info(
             f"AsiaSessionSweepDetector initialized: "
             f"session={session_start}-{session_end}, "
@@ -95,25 +102,33 @@ class AsiaSessionSweepDetector:
             if not all(col in data.columns for col in required_cols):
                 return self._create_error_signal(symbol, f"Missing required columns. Need: {required_cols}")
             
-            # Ensure timestamp is datetime
-            if not pd.api.types.is_datetime64_any_dtype(data['timestamp']):
-                data = data.copy()
-                data['timestamp'] = pd.to_datetime(data['timestamp'])
+            # Most calls land outside the signal window; when the frame is already
+            # in time order, decide that from the last candle alone instead of
+            # normalizing and sorting the full history first
+            timestamps = data['timestamp']
+            if (len(data) >= 2 and pd.api.types.is_datetime64_any_dtype(timestamps)
+                    and timestamps.is_monotonic_increasing):
+                last_timestamp = timestamps.iloc[-1]
+                if last_timestamp.tzinfo is None:
+                    last_timestamp = last_timestamp.tz_localize('UTC')
+                else:
+                    last_timestamp = last_timestamp.tz_convert('UTC')
+                if not self._is_signal_window(last_timestamp.time()):
+                    return self._create_outside_window_signal(symbol, last_timestamp)
             
-            # Ensure timezone awareness (assume UTC if naive)
-            if data['timestamp'].dt.tz is None:
-                data = data.copy()
-                data['timestamp'] = data['timestamp'].dt.tz_localize('UTC')
-            else:
-                data = data.copy()
-                data['timestamp'] = data['timestamp'].dt.tz_convert('UTC')
+            # Parse timestamps and normalize to UTC in one pass (naive values are
+            # taken as UTC); assign returns a new frame so the caller's is untouched
+            data = data.assign(timestamp=pd.to_datetime(data['timestamp'], utc=True))
             
-            # Sort by timestamp
-            data = data.sort_values('timestamp').reset_index(drop=True)
+            # Sort by timestamp (live data normally arrives in order)
+            if not data['timestamp'].is_monotonic_increasing:
+                data = data.sort_values('timestamp', kind='mergesort', ignore_index=True)
             
-            # Get the last candle (most recent)
-            last_candle = data.iloc[-1]
-            last_timestamp = last_candle['timestamp']
+            # Get the last candle (most recent). Candle fields are read positionally
+            # from column arrays; a row via iloc would build a mixed-dtype Series
+            opens = data['open'].to_numpy()
+            closes = data['close'].to_numpy()
+            last_timestamp = data['timestamp'].iloc[-1]
             last_time = last_timestamp.time()
             
             # Check if we have enough data for previous candle analysis
@@ -123,8 +138,7 @@ class AsiaSessionSweepDetector:
             
             # Check if we're in the signal timing window
             if not self._is_signal_window(last_time):
-                reason = f"Outside signal window (8:30-9:00 UTC). Current time: {last_time}"
-                return self._create_no_signal(symbol, reason, last_timestamp)
+                return self._create_outside_window_signal(symbol, last_timestamp)
             
             # Get today's date for session filtering
             current_date = last_timestamp.date()
@@ -142,15 +156,14 @@ class AsiaSessionSweepDetector:
             session_low = session_candles['low'].min()
 
             # Check for signals
-            current_price = last_candle['close']
-            current_open = last_candle['open']
+            current_price = closes[-1]
+            current_open = opens[-1]
             is_bearish = current_price < current_open
             is_bullish = current_price > current_open
             
             # Get the previous candle (second-to-last)
-            prev_candle = data.iloc[-2]
-            prev_close = prev_candle['close']
-            prev_open = prev_candle['open']
+            prev_close = closes[-2]
+            prev_open = opens[-2]
             prev_is_bearish = prev_close < prev_open
             prev_is_bullish = prev_close > prev_open
             
@@ -213,19 +226,20 @@ class AsiaSessionSweepDetector:
         Returns:
             DataFrame containing only session candles
         """
-        # Filter for target date
-        data_today = data[data['timestamp'].dt.date == target_date].copy()
+        # Whole minutes since epoch (UTC); split into day number and minute of day
+        # so both filters are integer compares instead of per-row date/time objects
+        minutes = data['timestamp'].values.astype('datetime64[m]').astype(np.int64)
+        day, minute_of_day = np.divmod(minutes, _MINUTES_PER_DAY)
+        target_day = np.datetime64(target_date, 'D').astype(np.int64)
         
-        # Filter for session hours
-        session_candles = data_today[
-            data_today['timestamp'].dt.time.between(
-                self.session_start, 
-                self.session_end,
-                inclusive='left'  # Include start, exclude end
-            )
-        ]
+        # Filter for target date and session hours (include start, exclude end)
+        in_session = (
+            (day == target_day)
+            & (minute_of_day >= self._session_start_minute)
+            & (minute_of_day < self._session_end_minute)
+        )
         
-        return session_candles
+        return data[in_session]
     
     def _create_long_signal(self, symbol: str, current_price: float, 
                            session_high: float, session_low: float,
@@ -279,6 +293,11 @@ class AsiaSessionSweepDetector:
         
         return result
     
+    def _create_outside_window_signal(self, symbol: str, timestamp: datetime) -> Dict:
+        """Create a no-signal response for a candle outside the signal window."""
+        reason = f"Outside signal window (8:30-9:00 UTC). Current time: {timestamp.time()}"
+        return self._create_no_signal(symbol, reason, timestamp)
+    
     def _create_error_signal(self, symbol: str, error_message: str) -> Dict:
         """Create an error signal response."""
         return {
@@ -14,6 +14,10 @@ class CustomStrategyConfigLoader:
     def __init__(self, config_path: str):
         self.config_path = config_path
         self.config = self._load_config()
+        # First entry wins for duplicate symbols, as with a linear scan
+        self._assets_by_symbol = {}
+        for asset in self.get_assets():
+            self._assets_by_symbol.setdefault(asset['symbol'], asset)
         logger.info(f"Loaded config from {config_path}")
     
     def _load_config(self) -> Dict:
@@ -29,10 +33,7 @@ class CustomStrategyConfigLoader:
         return self.config.get('assets', [])
     
     def get_asset_by_symbol(self, symbol: str) -> Optional[Dict]:
-        for asset in self.get_assets():
-            if asset['symbol'] == symbol:
-                return asset
-        return None
+        return self._assets_by_symbol.get(symbol)
     
     def get_strategy(self, strategy_name: str) -> Optional[Dict]:
         return self.config.get('strategies', {}).get(strategy_name)
@@ -57,8 +57,14 @@ class SignalChartGenerator:
                             indicators: Optional[Dict[str, pd.DataFrame]] = None,
                             symbol: str = "",
                             strategy_name: Optional[str] = None,
-                            custom_strategy: Optional[str] = None) -> Optional[bytes]:
-        """Generate chart image for trading signal. Accepts pre-calculated indicators."""
+                            custom_strategy: Optional[str] = None,
+                            png_compress_level: int = 6) -> Optional[bytes]:
+        """
+        Generate chart image for trading signal. Accepts pre-calculated indicators.
+        
+        png_compress_level (0-9) trades file size for encode time; the default
+        suits charts sent over Telegram, tests can pass 1 for faster encoding.
+        """
         if not MPLFINANCE_AVAILABLE:
             return None
         
@@ -86,7 +92,8 @@ class SignalChartGenerator:
             
             has_rsi = 'rsi' in indicators and indicators['rsi'] is not None
             chart_buffer = self.chart_renderer.render_chart(
-                plot_data, additional_plots, signal_data, clean_symbol, has_rsi
+                plot_data, additional_plots, signal_data, clean_symbol, has_rsi,
+                png_compress_level=png_compress_level
             )
             
             if chart_buffer:
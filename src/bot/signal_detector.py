@@ -61,8 +61,9 @@ class LiveOrderCapture(MeanReversionStrategy):
         current_real_time = datetime.now(timezone.utc)
         
         # Check if order is too old (more than 10 minutes from now)
-        if hasattr(self, 'order_entry_time'):
-            order_time = self.order_entry_time
+        if getattr(self, 'order_entry_time', None) is not None:
+            # The strategy stores entry time as Backtrader's float date number
+            order_time = bt.num2date(self.order_entry_time)
         else:
             # Fallback to current candle time if order time not available
             order_time = self.datas[0].datetime.datetime(0)
@@ -43,6 +43,53 @@ class Indicators:
         Raises:
             ValueError: If required columns are missing, data is empty, or invalid anchor_period
         """
+        Indicators._validate_vwap_input(df, [anchor_period])
+        
+        # Calculate typical price using vectorized operations
+        typical_price = (df['high'] + df['low'] + df['close']) / 3
+        volume_weighted_price = typical_price * df['volume']
+        
+        return Indicators._anchored_vwap(
+            df, typical_price, volume_weighted_price, anchor_period, num_std, bands_multiplier
+        )
+    
+    @staticmethod
+    def vwap_multi_anchor(df: pd.DataFrame, anchor_periods=('day', 'week', 'month', 'year'),
+                          num_std: float = 1.0, bands_multiplier: float = 1.0) -> dict[str, tuple[pd.Series, pd.Series, pd.Series]]:
+        """
+        Calculate anchored VWAP for several anchor periods in one call.
+        
+        Equivalent to calling vwap_daily_reset once per period, but the typical
+        price and volume-weighted price are computed once and shared.
+        
+        Args:
+            df: DataFrame with OHLCV data and datetime index
+            anchor_periods: Iterable of reset periods - 'day', 'week', 'month', 'year'
+            num_std: Number of standard deviations for bands
+            bands_multiplier: Multiplier to make bands wider/narrower (default: 1.0)
+            
+        Returns:
+            dict: anchor_period -> (vwap, vwap_upper, vwap_lower) as pandas Series
+            
+        Raises:
+            ValueError: If required columns are missing, data is empty, or any anchor_period is invalid
+        """
+        anchor_periods = list(anchor_periods)
+        Indicators._validate_vwap_input(df, anchor_periods)
+        
+        typical_price = (df['high'] + df['low'] + df['close']) / 3
+        volume_weighted_price = typical_price * df['volume']
+        
+        return {
+            period: Indicators._anchored_vwap(
+                df, typical_price, volume_weighted_price, period, num_std, bands_multiplier
+            )
+            for period in anchor_periods
+        }
+    
+    @staticmethod
+    def _validate_vwap_input(df: pd.DataFrame, anchor_periods) -> None:
+        """Raise ValueError if df or any anchor period is unusable for anchored VWAP."""
         if df.empty:
             raise ValueError("Input DataFrame is empty")
         
@@ -52,13 +99,15 @@ class Indicators:
             raise ValueError(f"Missing required columns: {missing}")
         
         valid_periods = {'day', 'week', 'month', 'year'}
-        if anchor_period not in valid_periods:
-            raise ValueError(f"Invalid anchor_period '{anchor_period}'. Must be one of: {valid_periods}")
-        
-        # Calculate typical price using vectorized operations
-        typical_price = (df['high'] + df['low'] + df['close']) / 3
-        volume_weighted_price = typical_price * df['volume']
-        
+        for anchor_period in anchor_periods:
+            if anchor_period not in valid_periods:
+                raise ValueError(f"Invalid anchor_period '{anchor_period}'. Must be one of: {valid_periods}")
+    
+    @staticmethod
+    def _anchored_vwap(df: pd.DataFrame, typical_price: pd.Series, volume_weighted_price: pd.Series,
+                       anchor_period: str, num_std: float,
+                       bands_multiplier: float) -> tuple[pd.Series, pd.Series, pd.Series]:
+        """Calculate VWAP and bands resetting every anchor_period from precomputed price series."""
         # Create grouping key based on anchor period
         def _get_period_key(timestamp):
             """Generate grouping key based on anchor period."""
@@ -251,6 +251,54 @@ class RiskManager:
         except Exception as e:
             return False, f"Validation error: {str(e)}"
 
+    def calculate_trade_levels(self, entry_price: float, atr_value: float,
+                               position_type: str) -> Tuple[float, float, bool, str, Dict[str, float]]:
+        """
+        Calculate stop loss, take profit, validation result and risk metrics in one pass.
+
+        Produces the same values as calling calculate_atr_stop_loss, calculate_take_profit,
+        validate_trade and get_risk_metrics in sequence, but resolves the position
+        direction once and shares the intermediate risk/reward distances.
+
+        Args:
+            entry_price: Entry price of the position
+            atr_value: Average True Range value at entry
+            position_type: 'long' or 'short'
+
+        Returns:
+            Tuple of (stop_loss, take_profit, is_valid, reason, risk_metrics)
+        """
+        direction = position_type.lower()
+        if direction == 'long':
+            sign = 1.0
+        elif direction == 'short':
+            sign = -1.0
+        else:
+            raise ValueError("position_type must be 'long' or 'short'")
+
+        stop_loss = entry_price - sign * (atr_value * self.stop_loss_atr_multiplier)
+        risk = sign * (entry_price - stop_loss)
+        take_profit = entry_price + sign * risk * self.risk_reward_ratio
+        reward = sign * (take_profit - entry_price)
+
+        rr_ratio = reward / risk if risk > 0 else 0
+        risk_metrics = {
+            'risk_amount': risk,
+            'reward_amount': reward,
+            'risk_reward_ratio': rr_ratio,
+            'breakeven_win_rate': 1 / (1 + rr_ratio) if rr_ratio > 0 else 0,
+            'risk_percentage': self.risk_per_position_pct
+        }
+
+        # Same criteria and order as validate_trade
+        min_rr = 1.0
+        if rr_ratio < min_rr:
+            return stop_loss, take_profit, False, f"Risk-reward ratio {rr_ratio:.2f} below minimum {min_rr}", risk_metrics
+        if risk <= 0:
+            return stop_loss, take_profit, False, "Risk amount must be positive", risk_metrics
+
+        return stop_loss, take_profit, True, "Trade passes risk management validation", risk_metrics
+
 
 class ATRIndicator(bt.Indicator):
     """
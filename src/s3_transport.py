@@ -18,6 +18,13 @@ try:
 except ImportError:
     BOTO3_AVAILABLE = False
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 from .transport import TransportInterface
 
 logger = logging.getLogger(__name__)
@@ -29,7 +36,9 @@ class S3Transport(TransportInterface):
     def __init__(self, bucket_name: str, prefix: str = "", 
                  aws_access_key_id: Optional[str] = None,
                  aws_secret_access_key: Optional[str] = None,
-                 region_name: str = 'us-east-1'):
+                 region_name: str = 'us-east-1',
+                 session: Optional[Any] = None,
+                 s3_client: Optional[Any] = None):
         """
         Initialize S3 transport.
         
@@ -39,6 +48,8 @@ class S3Transport(TransportInterface):
             aws_access_key_id: AWS access key (uses env vars if None)
             aws_secret_access_key: AWS secret key (uses env vars if None)
             region_name: AWS region
+            session: Existing boto3 Session to create the client from (optional)
+            s3_client: Existing boto3 S3 client to reuse; takes precedence over session (optional)
         """
         if not BOTO3_AVAILABLE:
             raise ImportError("boto3 is required for S3Transport. Install with: pip install boto3")
@@ -46,17 +57,13 @@ class S3Transport(TransportInterface):
         self.bucket_name = bucket_name
         self.prefix = prefix.rstrip('/') + '/' if prefix else ''
         
-        # Initialize S3 client
-        session_kwargs = {'region_name': region_name}
-        if aws_access_key_id and aws_secret_access_key:
-            session_kwargs.update({
-                'aws_access_key_id': aws_access_key_id,
-                'aws_secret_access_key': aws_secret_access_key
-            })
-        
         try:
-            session = boto3.Session(**session_kwargs)
-            self.s3_client = session.client('s3')
+            # Initialize S3 client, reusing the caller's client or session when given
+            if s3_client is None:
+                if session is None:
+                    session = self.create_session(aws_access_key_id, aws_secret_access_key, region_name)
+                s3_client = session.client('s3')
+            self.s3_client = s3_client
             
             # Test connection
             self.s3_client.head_bucket(Bucket=bucket_name)
@@ -70,6 +77,22 @@ class S3Transport(TransportInterface):
             else:
                 raise ValueError(f"Error connecting to S3: {e}")
     
+    @staticmethod
+    def create_session(aws_access_key_id: Optional[str] = None,
+                       aws_secret_access_key: Optional[str] = None,
+                       region_name: str = 'us-east-1') -> Any:
+        """Create a boto3 Session, using explicit credentials only when both are given."""
+        if not BOTO3_AVAILABLE:
+            raise ImportError("boto3 is required for S3Transport. Install with: pip install boto3")
+        
+        session_kwargs = {'region_name': region_name}
+        if aws_access_key_id and aws_secret_access_key:
+            session_kwargs.update({
+                'aws_access_key_id': aws_access_key_id,
+                'aws_secret_access_key': aws_secret_access_key
+            })
+        return boto3.Session(**session_kwargs)
+    
     def _get_s3_key(self, key: str) -> str:
         """Convert key to S3 object key with prefix."""
         clean_key = key.strip('/')
@@ -240,6 +263,49 @@ class S3Transport(TransportInterface):
             logger.error(f"Error loading CSV from S3 {key}: {e}")
             return None
     
+    def save_dataframe(self, key: str, data: pd.DataFrame) -> bool:
+        """Save DataFrame as Parquet file."""
+        if not PYARROW_AVAILABLE:
+            logger.error(f"Error saving Parquet to S3 {key}: pyarrow is required. Install with: pip install pyarrow")
+            return False
+        try:
+            parquet_buffer = io.BytesIO()
+            pq.write_table(pa.Table.from_pandas(data), parquet_buffer, compression='zstd')
+            
+            self.s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=self._get_s3_key(key),
+                Body=parquet_buffer.getvalue(),
+                ContentType='application/vnd.apache.parquet'
+            )
+            
+            logger.debug(f"Saved Parquet to S3: {key}")
+            return True
+        except Exception as e:
+            logger.error(f"Error saving Parquet to S3 {key}: {e}")
+            return False
+    
+    def load_dataframe(self, key: str) -> Optional[pd.DataFrame]:
+        """Load Parquet data as DataFrame."""
+        if not PYARROW_AVAILABLE:
+            logger.error(f"Error loading Parquet from S3 {key}: pyarrow is required. Install with: pip install pyarrow")
+            return None
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=self._get_s3_key(key))
+            data = pq.read_table(io.BytesIO(response['Body'].read())).to_pandas()
+            
+            logger.debug(f"Loaded Parquet from S3: {key}")
+            return data
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'NoSuchKey':
+                return None
+            else:
+                logger.error(f"Error loading Parquet from S3 {key}: {e}")
+                return None
+        except Exception as e:
+            logger.error(f"Error loading Parquet from S3 {key}: {e}")
+            return None
+    
     def delete(self, key: str) -> bool:
         """Delete file at key."""
         try:
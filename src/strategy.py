@@ -1,6 +1,10 @@
 import backtrader as bt
+import numpy as np
 import pandas as pd
+import io
 import logging
+import sys
+from types import SimpleNamespace
 from .indicators import Indicators
 from .risk_management import RiskManager, ATRIndicator, create_risk_manager
 from .strategy_config import DEFAULT_CONFIG
@@ -8,6 +12,65 @@ from .market_regime import MarketRegimeFilter
 
 logger = logging.getLogger(__name__)
 
+# Fallbacks for parameters that may be missing from a custom params set.
+# Resolved once per strategy instance into self._p.
+_PARAM_DEFAULTS = {
+    'timeframe': '15m',
+    'require_reversal': True,
+    'regime_enabled': True,
+    'regime_adx_period': 14,
+    'regime_volatility_period': 14,
+    'regime_volatility_lookback': 100,
+    'regime_min_score': 60,
+    'order_lifetime_minutes': {
+        '5m': 360,    # 6 hours for 5-minute timeframe
+        '15m': 720,   # 12 hours for 15-minute timeframe
+        '1h': 2880,   # 2 days for 1-hour timeframe
+        'default': 720
+    },
+}
+
+# Numeric order fields, stored column-wise next to the order_log dicts so that
+# outcome bookkeeping and summary statistics run as array operations.
+ORDER_DTYPE = np.dtype([
+    ('entry_price', 'f8'),
+    ('stop_loss', 'f8'),
+    ('take_profit', 'f8'),
+    ('position_size', 'f8'),
+    ('atr_value', 'f8'),
+    ('is_long', '?'),
+    ('pnl', 'f8'),
+    ('has_outcome', '?'),
+])
+
+# Numeric order_log fields that are always present; unknown values are NaN
+_ORDER_NUMERIC_FIELDS = (
+    'entry_price', 'stop_loss', 'take_profit', 'position_size', 'atr_value',
+    'risk_amount', 'reward_amount', 'risk_reward_ratio', 'account_risk_pct',
+    'deposit_before_trade',
+)
+
+def _check_exit(high, low, stop_price, take_profit_price, is_long):
+    """
+    Decide whether an open position hits its stop loss or take profit on this bar.
+    
+    Stop loss is checked before take profit when both are touched by the same bar.
+    
+    Returns:
+        'stop_loss', 'take_profit' or None
+    """
+    if is_long:
+        if low <= stop_price:
+            return 'stop_loss'
+        if high >= take_profit_price:
+            return 'take_profit'
+    else:
+        if high >= stop_price:
+            return 'stop_loss'
+        if low <= take_profit_price:
+            return 'take_profit'
+    return None
+
 class MeanReversionStrategy(bt.Strategy):
     # Get default params and extend with timeframe and risk management
     base_params = DEFAULT_CONFIG.get_backtrader_params()
@@ -25,14 +88,22 @@ class MeanReversionStrategy(bt.Strategy):
     params = tuple(base_params.items())
 
     def __init__(self):
+        # Resolve optional parameters once so hot paths use plain attribute access
+        self._p = SimpleNamespace(**{
+            name: getattr(self.p, name, default) for name, default in _PARAM_DEFAULTS.items()
+        })
+        
         self.dataclose = self.datas[0].close
         self.order = None
         self.buyprice = None
         self.buycomm = None
         self.trade_log = []
         self.order_log = []  # New log for all found orders
+        self._order_index = {}  # order_id -> position in order_log
+        self._order_arr = np.zeros(64, dtype=ORDER_DTYPE)  # columnar mirror of order_log, grown on demand
+        self._n_orders = 0
         
-        # Order lifetime tracking
+        # Order lifetime tracking (entry time is Backtrader's float date number, in days)
         self.order_entry_time = None
         self.order_lifetime_minutes = None
         
@@ -67,16 +138,20 @@ class MeanReversionStrategy(bt.Strategy):
         self.atr = ATRIndicator(self.datas[0], period=self.p.atr_period)
         
         # Market regime detection filter
-        if getattr(self.p, 'regime_enabled', True):
+        if self._p.regime_enabled:
             self.regime_filter = MarketRegimeFilter(
-                adx_period=getattr(self.p, 'regime_adx_period', 14),
-                volatility_period=getattr(self.p, 'regime_volatility_period', 14),
-                volatility_lookback=getattr(self.p, 'regime_volatility_lookback', 100),
-                min_score_threshold=getattr(self.p, 'regime_min_score', 60)
+                adx_period=self._p.regime_adx_period,
+                volatility_period=self._p.regime_volatility_period,
+                volatility_lookback=self._p.regime_volatility_lookback,
+                min_score_threshold=self._p.regime_min_score
             )
         else:
             self.regime_filter = None
         
+        # Leveraged broker hooks, resolved once (None for a standard broker)
+        self._get_actual_cash = getattr(self.broker, 'get_actual_cash', None)
+        self._add_trade_pnl = getattr(self.broker, 'add_trade_pnl', None)
+        
         # Risk management variables
         self.stop_price = None
         self.take_profit_price = None
@@ -85,19 +160,29 @@ class MeanReversionStrategy(bt.Strategy):
         self.current_order_id = None
         self.deposit_before_trade = None
         
-        # Equity curve tracking for proper portfolio value history
-        self.equity_curve = []
+        # Equity curve tracking for proper portfolio value history.
+        # With a leveraged broker the curve only changes through broker notifications,
+        # so those state changes are recorded and the per-bar curve is rebuilt in one
+        # vectorized pass at stop(). Standard brokers mark positions internally and
+        # are sampled every bar into arrays preallocated in start().
+        # equity_curve is exported as a float64 array; equity_dates stays a list of
+        # datetimes for the plotting code.
+        self.equity_curve = np.empty(0, dtype=np.float64)
         self.equity_dates = []
+        self._track_value_per_bar = self._get_actual_cash is None
+        self._first_next_bar = None
+        self._equity_values = None
+        self._equity_datenums = None
+        self._bar_idx = 0
+        self._portfolio_events = []  # (bar number, actual cash, position size, position price)
         
         # Set order lifetime based on timeframe
-        timeframe = getattr(self.p, 'timeframe', '15m')
-        order_lifetime_dict = getattr(self.p, 'order_lifetime_minutes', {
-            '5m': 360,    # 6 hours for 5-minute timeframe
-            '15m': 720,   # 12 hours for 15-minute timeframe
-            '1h': 2880,   # 2 days for 1-hour timeframe
-            'default': 720
-        })
+        timeframe = self._p.timeframe
+        order_lifetime_dict = self._p.order_lifetime_minutes
         self.order_lifetime_minutes = order_lifetime_dict.get(timeframe, order_lifetime_dict.get('default', 720))
+        # Lifetime in date-number units so next() only needs a float subtraction.
+        # The tiny tolerance absorbs float rounding of the date numbers at the exact boundary.
+        self._order_lifetime_days = self.order_lifetime_minutes / 1440.0 - 1e-9
 
     def _is_trading_hours(self):
         """
@@ -111,9 +196,24 @@ class MeanReversionStrategy(bt.Strategy):
         # Trading hours: 6 UTC to 17 UTC (6:00 - 17:00)
         return 6 <= current_hour < 17
 
+    def start(self):
+        """Record the initial portfolio state before the first bar"""
+        if self._track_value_per_bar:
+            # Preloaded feeds know their full length here; live feeds grow on demand
+            n_bars = max(self.datas[0].buflen(), 1)
+            self._equity_values = np.empty(n_bars, dtype=np.float64)
+            self._equity_datenums = np.empty(n_bars, dtype=np.float64)
+        self._record_portfolio_state()
+
+    def nextstart(self):
+        """Called once on the first bar where all indicators are ready"""
+        self._first_next_bar = len(self)
+        self.next()
+
     def next(self):
         # Track portfolio value for equity curve (do this first)
-        self._track_portfolio_value()
+        if self._track_value_per_bar:
+            self._track_portfolio_value()
         
         # Skip if ATR is not available yet
         if len(self.atr) == 0 or self.atr[0] == 0:
@@ -121,11 +221,10 @@ class MeanReversionStrategy(bt.Strategy):
         
         # Check if current position has exceeded order lifetime and force close
         if self.position and self.order_entry_time is not None:
-            current_time = self.datas[0].datetime.datetime(0)
-            time_elapsed = current_time - self.order_entry_time
-            minutes_elapsed = time_elapsed.total_seconds() / 60
+            days_elapsed = self.datas[0].datetime[0] - self.order_entry_time
             
-            if minutes_elapsed >= self.order_lifetime_minutes:
+            if days_elapsed >= self._order_lifetime_days:
+                minutes_elapsed = days_elapsed * 1440.0
                 logger.info(f"FORCE CLOSING position after {minutes_elapsed:.1f} minutes (lifetime: {self.order_lifetime_minutes} minutes)")
                 self.close()
                 self._record_trade_outcome('lifetime_expired', self.dataclose[0])  # Only for lifetime expiry use market price
@@ -145,7 +244,7 @@ class MeanReversionStrategy(bt.Strategy):
                 
                 # Check for reversal confirmation if required
                 reversal_confirmed = True
-                if self.p.require_reversal:
+                if self._p.require_reversal:
                     reversal_confirmed = (self.dataclose[-1] < self.bb_lower[-1] and 
                                         self.dataclose[0] > self.dataclose[-1])
                 
@@ -169,19 +268,10 @@ class MeanReversionStrategy(bt.Strategy):
                             regime_reason = "Insufficient data for regime analysis"
                     
                     if regime_suitable:
-                        # Calculate risk management levels
+                        # Calculate risk management levels, validation and metrics in one pass
                         entry_price = self.dataclose[0]
-                        stop_loss = self.risk_manager.calculate_atr_stop_loss(
-                            entry_price, self.atr[0], 'long'
-                        )
-                        take_profit = self.risk_manager.calculate_take_profit(
-                            entry_price, stop_loss, 'long'
-                        )
-                        
-                        # Validate trade before execution
-                        is_valid, reason = self.risk_manager.validate_trade(
-                            entry_price, stop_loss, take_profit, 'long'
-                        )
+                        stop_loss, take_profit, is_valid, reason, risk_metrics = \
+                            self.risk_manager.calculate_trade_levels(entry_price, self.atr[0], 'long')
                         
                         if is_valid:
                             # Calculate position size based on risk
@@ -199,12 +289,7 @@ class MeanReversionStrategy(bt.Strategy):
                             self.take_profit_price = take_profit
                             
                             # Set position entry time immediately since market orders execute right away
-                            self.order_entry_time = self.datas[0].datetime.datetime(0)
-                            
-                            # Get risk metrics for logging
-                            risk_metrics = self.risk_manager.get_risk_metrics(
-                                entry_price, stop_loss, take_profit, 'long'
-                            )
+                            self.order_entry_time = self.datas[0].datetime[0]
                             
                             # Create unique order ID
                             order_id = f"BUY_{self.datas[0].datetime.date(0).isoformat()}_{self.datas[0].datetime.time(0).isoformat().replace(':', '')}"
@@ -236,7 +321,7 @@ class MeanReversionStrategy(bt.Strategy):
                                 'regime_volatility_percentile': regime_info.get('volatility_percentile', 0),
                                 'regime_classification': regime_info.get('regime', 'unknown')
                             }
-                            self.order_log.append(order_info)
+                            self._append_order(order_info)
                             
                             logger.info(f"ORDER FOUND - {order_info['date']} {order_info['time']}: "
                                       f"{order_info['type']} {position_size} units at {entry_price:.4f}, "
@@ -257,7 +342,7 @@ class MeanReversionStrategy(bt.Strategy):
                 
                 # Check for reversal confirmation if required
                 reversal_confirmed = True
-                if self.p.require_reversal:
+                if self._p.require_reversal:
                     reversal_confirmed = (self.dataclose[-1] > self.bb_upper[-1] and 
                                         self.dataclose[0] < self.dataclose[-1])
                 
@@ -281,19 +366,10 @@ class MeanReversionStrategy(bt.Strategy):
                             regime_reason = "Insufficient data for regime analysis"
 
                     if regime_suitable:
-                        # Calculate risk management levels
+                        # Calculate risk management levels, validation and metrics in one pass
                         entry_price = self.dataclose[0]
-                        stop_loss = self.risk_manager.calculate_atr_stop_loss(
-                            entry_price, self.atr[0], 'short'
-                        )
-                        take_profit = self.risk_manager.calculate_take_profit(
-                            entry_price, stop_loss, 'short'
-                        )
-                        
-                        # Validate trade before execution
-                        is_valid, reason = self.risk_manager.validate_trade(
-                            entry_price, stop_loss, take_profit, 'short'
-                        )
+                        stop_loss, take_profit, is_valid, reason, risk_metrics = \
+                            self.risk_manager.calculate_trade_levels(entry_price, self.atr[0], 'short')
                         
                         if is_valid:
                             # Calculate position size based on risk
@@ -311,12 +387,7 @@ class MeanReversionStrategy(bt.Strategy):
                             self.take_profit_price = take_profit
                             
                             # Set position entry time immediately since market orders execute right away
-                            self.order_entry_time = self.datas[0].datetime.datetime(0)
-                            
-                            # Get risk metrics for logging
-                            risk_metrics = self.risk_manager.get_risk_metrics(
-                                entry_price, stop_loss, take_profit, 'short'
-                            )
+                            self.order_entry_time = self.datas[0].datetime[0]
                             
                             # Create unique order ID
                             order_id = f"SELL_{self.datas[0].datetime.date(0).isoformat()}_{self.datas[0].datetime.time(0).isoformat().replace(':', '')}"
@@ -348,7 +419,7 @@ class MeanReversionStrategy(bt.Strategy):
                                 'regime_volatility_percentile': regime_info.get('volatility_percentile', 0),
                                 'regime_classification': regime_info.get('regime', 'unknown')
                             }
-                            self.order_log.append(order_info)
+                            self._append_order(order_info)
                             
                             logger.info(f"ORDER FOUND - {order_info['date']} {order_info['time']}: "
                                       f"{order_info['type']} {position_size} units at {entry_price:.4f}, "
@@ -364,22 +435,16 @@ class MeanReversionStrategy(bt.Strategy):
                             })
         else:
             # Position management - Exit on stop loss or take profit
-            if self.position.size > 0:  # Long position
-                # Check if low touched stop loss
-                if self.datas[0].low[0] <= self.stop_price:
+            position_size = self.position.size
+            if position_size != 0:
+                data = self.datas[0]
+                exit_type = _check_exit(data.high[0], data.low[0],
+                                        self.stop_price, self.take_profit_price,
+                                        position_size > 0)
+                if exit_type == 'stop_loss':
                     self.close()
                     self._record_trade_outcome('stop_loss', self.stop_price)  # Use exact SL price
-                # Check if high touched take profit
-                elif self.datas[0].high[0] >= self.take_profit_price:
-                    self.close()
-                    self._record_trade_outcome('take_profit', self.take_profit_price)  # Use exact TP price
-            elif self.position.size < 0:  # Short position
-                # Check if high touched stop loss
-                if self.datas[0].high[0] >= self.stop_price:
-                    self.close()
-                    self._record_trade_outcome('stop_loss', self.stop_price)  # Use exact SL price
-                # Check if low touched take profit
-                elif self.datas[0].low[0] <= self.take_profit_price:
+                elif exit_type == 'take_profit':
                     self.close()
                     self._record_trade_outcome('take_profit', self.take_profit_price)  # Use exact TP price
 
@@ -416,23 +481,24 @@ class MeanReversionStrategy(bt.Strategy):
             
             # Mark the order as cancelled in the log
             if hasattr(self, 'current_order_id') and self.current_order_id:
-                for order_log_entry in self.order_log:
-                    if order_log_entry.get('order_id') == self.current_order_id:
-                        order_log_entry['trade_outcome'] = {
-                            'type': 'order_cancelled',
-                            'exit_price': self.dataclose[0],
-                            'exit_date': self.datas[0].datetime.date(0).isoformat(),
-                            'exit_time': self.datas[0].datetime.time(0).isoformat(),
-                            'pnl': 0.0,
-                            'deposit_before': order_log_entry.get('deposit_before_trade', 0),
-                            'deposit_after': order_log_entry.get('deposit_before_trade', 0),
-                            'deposit_change': 0.0
-                        }
-                        break
+                order_log_entry = self._find_order(self.current_order_id)
+                if order_log_entry is not None:
+                    self._set_order_outcome(self.current_order_id, {
+                        'type': 'order_cancelled',
+                        'exit_price': self.dataclose[0],
+                        'exit_date': self.datas[0].datetime.date(0).isoformat(),
+                        'exit_time': self.datas[0].datetime.time(0).isoformat(),
+                        'pnl': 0.0,
+                        'deposit_before': order_log_entry['deposit_before_trade'],
+                        'deposit_after': order_log_entry['deposit_before_trade'],
+                        'deposit_change': 0.0
+                    })
                         
                 # Reset current order tracking
                 self.current_order_id = None
                 self.deposit_before_trade = None
+        
+        self._record_portfolio_state()
 
     def notify_trade(self, trade):
         if trade.isclosed:
@@ -441,29 +507,27 @@ class MeanReversionStrategy(bt.Strategy):
             # If we have pending outcome with exact exit price, recalculate P&L
             if hasattr(self, 'pending_outcome') and hasattr(self, 'current_order_id'):
                 # Find the corresponding order to get entry details
-                for order in self.order_log:
-                    if order.get('order_id') == self.current_order_id:
-                        entry_price = order['entry_price']
-                        exit_price = self.pending_outcome['exit_price']
-                        position_size = order.get('position_size', 0)
-                        order_type = order['type']
-                        
-                        # Calculate exact P&L based on entry and exact exit prices
-                        if order_type == 'BUY':  # Long position
-                            price_diff = exit_price - entry_price
-                        else:  # Short position (SELL)
-                            price_diff = entry_price - exit_price
-                        
-                        calculated_pnl = price_diff * position_size
-                        
-                        logger.debug(f"P&L Calculation: {order_type} {position_size} units, "
-                                  f"Entry: {entry_price:.4f}, Exit: {exit_price:.4f}, "
-                                  f"Diff: {price_diff:+.4f}, P&L: {calculated_pnl:+.4f}")
-                        break
+                order = self._find_order(self.current_order_id)
+                if order is not None:
+                    entry_price = order['entry_price']
+                    exit_price = self.pending_outcome['exit_price']
+                    position_size = order['position_size']
+                    order_type = order['type']
+                    
+                    # Calculate exact P&L based on entry and exact exit prices
+                    sign = 1.0 if order_type == 'BUY' else -1.0  # Long (BUY) or short (SELL)
+                    price_diff = sign * (exit_price - entry_price)
+                    
+                    calculated_pnl = price_diff * position_size
+                    
+                    logger.debug("P&L Calculation: %s %s units, "
+                                 "Entry: %.4f, Exit: %.4f, Diff: %+.4f, P&L: %+.4f",
+                                 order_type, position_size, entry_price, exit_price,
+                                 price_diff, calculated_pnl)
                     
             # Update broker's actual cash balance with calculated trade P&L
-            if hasattr(self.broker, 'add_trade_pnl'):
-                self.broker.add_trade_pnl(calculated_pnl)
+            if self._add_trade_pnl is not None:
+                self._add_trade_pnl(calculated_pnl)
 
             self.trade_log.append({'type': 'exit', 'price': trade.price, 'pnl': calculated_pnl})
             
@@ -477,28 +541,30 @@ class MeanReversionStrategy(bt.Strategy):
                 deposit_change = deposit_after - deposit_before
                 
                 # Find the order in order_log and add outcome
-                for order in self.order_log:
-                    if order.get('order_id') == self.current_order_id:
-                        order['trade_outcome'] = {
-                            'type': self.pending_outcome['type'],
-                            'exit_price': self.pending_outcome['exit_price'],
-                            'exit_date': self.pending_outcome['exit_date'],
-                            'exit_time': self.pending_outcome['exit_time'],
-                            'pnl': calculated_pnl,  # Use calculated P&L instead of trade.pnl
-                            'deposit_before': deposit_before,
-                            'deposit_after': deposit_after,
-                            'deposit_change': deposit_change
-                        }
-                        break
+                self._set_order_outcome(self.current_order_id, {
+                    'type': self.pending_outcome['type'],
+                    'exit_price': self.pending_outcome['exit_price'],
+                    'exit_date': self.pending_outcome['exit_date'],
+                    'exit_time': self.pending_outcome['exit_time'],
+                    'pnl': calculated_pnl,  # Use calculated P&L instead of trade.pnl
+                    'deposit_before': deposit_before,
+                    'deposit_after': deposit_after,
+                    'deposit_change': deposit_change
+                })
                 
                 # Reset tracking variables
                 self.current_order_id = None
                 self.deposit_before_trade = None
                 if hasattr(self, 'pending_outcome'):
                     delattr(self, 'pending_outcome')
+        
+        self._record_portfolio_state()
 
     def stop(self):
         """Called when the strategy stops - ensure all positions are closed and orders have outcomes"""
+        # Build the equity curve before the forced closures below touch the broker
+        self._build_equity_curve()
+        
         # Force close any remaining open position
         if self.position:
             logger.info(f"FORCE CLOSING remaining position at backtest end: {self.position.size} units")
@@ -508,37 +574,36 @@ class MeanReversionStrategy(bt.Strategy):
             # Let notify_trade handle the outcome recording
         
         # Find all orders without outcomes and add forced closure outcomes
-        orders_without_outcomes = [order for order in self.order_log if 'trade_outcome' not in order]
+        order_array = self.get_order_array()
+        pending_idx = np.flatnonzero(~order_array['has_outcome'])
+        orders_without_outcomes = [self.order_log[idx] for idx in pending_idx]
         
         if orders_without_outcomes:
             logger.info(f"FORCING OUTCOMES for {len(orders_without_outcomes)} incomplete orders at backtest end")
             
             current_price = self.dataclose[0]
-            current_date = self.datas[0].datetime.date(0).isoformat()
-            current_time = self.datas[0].datetime.time(0).isoformat()
+            dt_line = self.datas[0].datetime
+            current_date = dt_line.date(0).isoformat()
+            current_time = dt_line.time(0).isoformat()
             current_deposit = self.get_account_value_for_risk_management()
+            add_trade_pnl = self._add_trade_pnl
+            set_order_outcome = self._set_order_outcome
             
-            for order in orders_without_outcomes:
-                # Calculate PnL based on entry vs current price for backtest end closures
-                entry_price = order['entry_price']
-                position_size = order.get('position_size', 0)
-                
-                if order['type'] == 'BUY':
-                    # Long position
-                    price_diff = current_price - entry_price
-                else:
-                    # Short position  
-                    price_diff = entry_price - current_price
-                
-                calculated_pnl = price_diff * position_size
-                deposit_before = order.get('deposit_before_trade', current_deposit)
+            # Calculate PnL based on entry vs current price for all backtest end closures at once
+            # (sign is +1 for long and -1 for short positions)
+            pending = order_array[pending_idx]
+            signs = pending['is_long'] * 2.0 - 1.0
+            pnls = (signs * (current_price - pending['entry_price']) * pending['position_size']).tolist()
+            
+            for order, calculated_pnl in zip(orders_without_outcomes, pnls):
+                deposit_before = order['deposit_before_trade']
                 
                 # Update broker's actual cash with the forced closure P&L
-                if hasattr(self.broker, 'add_trade_pnl'):
-                    self.broker.add_trade_pnl(calculated_pnl)
+                if add_trade_pnl is not None:
+                    add_trade_pnl(calculated_pnl)
                 
                 # Add forced outcome
-                order['trade_outcome'] = {
+                set_order_outcome(order['order_id'], {
                     'type': 'backtest_end',
                     'exit_price': current_price,
                     'exit_date': current_date,
@@ -547,96 +612,177 @@ class MeanReversionStrategy(bt.Strategy):
                     'deposit_before': deposit_before,
                     'deposit_after': current_deposit,
                     'deposit_change': current_deposit - deposit_before
-                }
-                logger.debug(f"  Added forced outcome for {order['order_id']}: backtest_end @ {current_price:.4f}, P&L: {calculated_pnl:+.2f}")
+                })
+                logger.debug("  Added forced outcome for %s: backtest_end @ %.4f, P&L: %+.2f",
+                             order['order_id'], current_price, calculated_pnl)
         
         # Reset position tracking
         self.order_entry_time = None
         self.current_order_id = None
         self.deposit_before_trade = None
 
-    def get_order_log(self):
-        """Return the complete order log with guaranteed outcomes"""
+    def _append_order(self, order_info):
+        """Append an order to the log, index it by order_id and mirror its numeric fields"""
+        # Normalize once so readers can index fields directly
+        for field in _ORDER_NUMERIC_FIELDS:
+            order_info.setdefault(field, np.nan)
+        
+        idx = self._n_orders
+        if idx == len(self._order_arr):
+            self._order_arr = np.concatenate((self._order_arr, np.zeros_like(self._order_arr)))
+        row = self._order_arr[idx]
+        row['entry_price'] = order_info['entry_price']
+        row['stop_loss'] = order_info['stop_loss']
+        row['take_profit'] = order_info['take_profit']
+        row['position_size'] = order_info['position_size']
+        row['atr_value'] = order_info['atr_value']
+        row['is_long'] = order_info['type'] == 'BUY'
+        row['pnl'] = np.nan
+        self._n_orders = idx + 1
+        
+        self.order_log.append(order_info)
+        self._order_index[order_info['order_id']] = idx
+
+    def _find_order(self, order_id):
+        """Return the logged order with the given id, or None"""
+        idx = self._order_index.get(order_id)
+        return self.order_log[idx] if idx is not None else None
+
+    def _set_order_outcome(self, order_id, outcome):
+        """Attach a trade outcome to a logged order and mark it as resolved"""
+        idx = self._order_index.get(order_id)
+        if idx is None:
+            return
+        self.order_log[idx]['trade_outcome'] = outcome
+        row = self._order_arr[idx]
+        row['pnl'] = outcome.get('pnl', np.nan)
+        row['has_outcome'] = True
+
+    def get_order_log(self, as_frame=False):
+        """
+        Return the complete order log with guaranteed outcomes.
+        
+        With as_frame=True the numeric order fields are returned as a DataFrame
+        (indexed by order_id) built from the columnar order array, so analytics
+        can aggregate without iterating the dicts.
+        """
+        if as_frame:
+            return pd.DataFrame(self.get_order_array(),
+                                index=pd.Index([order['order_id'] for order in self.order_log], name='order_id'))
         return self.order_log
     
+    def get_order_array(self):
+        """Return the numeric order fields as a read-only structured array view (one row per order)"""
+        view = self._order_arr[:self._n_orders]
+        view.flags.writeable = False
+        return view
+    
     def print_order_summary(self):
         """Print a summary of all found orders with risk management details"""
         if not self.order_log:
             print("No orders found during strategy execution.")
             return
         
-        print(f"\n=== STRATEGY ORDER SUMMARY ===")
-        print(f"Total orders found: {len(self.order_log)}")
-        print(f"Risk Management: {self.risk_manager.risk_per_position_pct}% per position, "
+        # Build the whole report in one buffer and write it once
+        buf = io.StringIO()
+        write = buf.write
+        write(f"\n=== STRATEGY ORDER SUMMARY ===\n"
+              f"Total orders found: {len(self.order_log)}\n"
+              f"Risk Management: {self.risk_manager.risk_per_position_pct}% per position, "
               f"{self.risk_manager.stop_loss_atr_multiplier}x ATR stop loss, "
-              f"1:{self.risk_manager.risk_reward_ratio} R:R ratio")
-        print(f"Order Lifetime: {self.order_lifetime_minutes} minutes ({self.order_lifetime_minutes/60:.1f} hours)")
-        print("-" * 80)
+              f"1:{self.risk_manager.risk_reward_ratio} R:R ratio\n"
+              f"Order Lifetime: {self.order_lifetime_minutes} minutes ({self.order_lifetime_minutes/60:.1f} hours)\n"
+              f"{'-' * 80}\n")
         
-        orders_with_outcomes = 0
+        separator = "-" * 40 + "\n"
+        orders_with_outcomes = int(np.count_nonzero(self.get_order_array()['has_outcome']))
         for i, order in enumerate(self.order_log, 1):
-            print(f"Order #{i}:")
-            print(f"  Date/Time: {order['date']} {order['time']}")
-            print(f"  Type: {order['type']}")
-            print(f"  Position Size: {order.get('position_size', 'N/A')} units")
-            print(f"  Entry Price: {order['entry_price']:.4f}")
-            print(f"  Stop Loss: {order['stop_loss']:.4f}")
-            print(f"  Take Profit: {order['take_profit']:.4f}")
-            print(f"  ATR Value: {order.get('atr_value', 'N/A'):.4f}")
-            print(f"  Risk Amount: {order.get('risk_amount', 'N/A'):.4f}")
-            print(f"  Reward Amount: {order.get('reward_amount', 'N/A'):.4f}")
-            print(f"  Risk/Reward Ratio: 1:{order.get('risk_reward_ratio', 'N/A'):.2f}")
-            print(f"  Account Risk %: {order.get('account_risk_pct', 'N/A'):.1f}%")
-            print(f"  Reason: {order['reason']}")
+            write(f"Order #{i}:\n"
+                  f"  Date/Time: {order['date']} {order['time']}\n"
+                  f"  Type: {order['type']}\n"
+                  f"  Position Size: {order['position_size']} units\n"
+                  f"  Entry Price: {order['entry_price']:.4f}\n"
+                  f"  Stop Loss: {order['stop_loss']:.4f}\n"
+                  f"  Take Profit: {order['take_profit']:.4f}\n"
+                  f"  ATR Value: {order['atr_value']:.4f}\n"
+                  f"  Risk Amount: {order['risk_amount']:.4f}\n"
+                  f"  Reward Amount: {order['reward_amount']:.4f}\n"
+                  f"  Risk/Reward Ratio: 1:{order['risk_reward_ratio']:.2f}\n"
+                  f"  Account Risk %: {order['account_risk_pct']:.1f}%\n"
+                  f"  Reason: {order['reason']}\n")
             
             # Show trade outcome if available
             if 'trade_outcome' in order:
                 outcome = order['trade_outcome']
-                print(f"  OUTCOME: {outcome['type'].upper()} at {outcome['exit_price']:.4f}")
-                print(f"           Exit: {outcome['exit_date']} {outcome['exit_time']}")
-                print(f"           PnL: {outcome.get('pnl', 'N/A'):+.4f}")
-                print(f"           Deposit Change: {outcome.get('deposit_change', 'N/A'):+.4f}")
-                orders_with_outcomes += 1
+                write(f"  OUTCOME: {outcome['type'].upper()} at {outcome['exit_price']:.4f}\n"
+                      f"           Exit: {outcome['exit_date']} {outcome['exit_time']}\n"
+                      f"           PnL: {outcome['pnl']:+.4f}\n"
+                      f"           Deposit Change: {outcome['deposit_change']:+.4f}\n")
             else:
-                print(f"  OUTCOME: NO OUTCOME RECORDED")
+                write("  OUTCOME: NO OUTCOME RECORDED\n")
             
-            print("-" * 40)
+            write(separator)
         
-        print(f"\nSUMMARY: {orders_with_outcomes}/{len(self.order_log)} orders have recorded outcomes")
+        write(f"\nSUMMARY: {orders_with_outcomes}/{len(self.order_log)} orders have recorded outcomes\n")
         if orders_with_outcomes < len(self.order_log):
-            print("WARNING: Some orders are missing outcomes - this should not happen with proper order lifetime management!")
+            write("WARNING: Some orders are missing outcomes - this should not happen with proper order lifetime management!\n")
+        
+        sys.stdout.write(buf.getvalue())
 
     def get_account_value_for_risk_management(self):
         """
         Get the correct account value for risk management calculations.
         For leveraged brokers, use actual cash instead of leveraged amount.
         """
-        if hasattr(self.broker, 'get_actual_cash'):
+        if self._get_actual_cash is not None:
             # Using leveraged broker - get actual cash for risk management
-            return self.broker.get_actual_cash()
+            return self._get_actual_cash()
         else:
             # Standard broker - use normal getvalue
             return self.broker.getvalue()
 
     def _track_portfolio_value(self):
-        """Track portfolio value for equity curve calculation"""
-        current_date = self.datas[0].datetime.datetime(0)
-        
-        # Calculate current portfolio value
-        if hasattr(self.broker, 'get_actual_cash'):
-            # For leveraged broker, use actual cash + unrealized P&L
-            actual_cash = self.broker.get_actual_cash()
-            # Calculate unrealized P&L from open positions
-            unrealized_pnl = 0.0
-            position = self.broker.getposition(self.datas[0])
-            if position.size != 0:
-                current_price = self.dataclose[0]
-                unrealized_pnl = position.size * (current_price - position.price)
-            portfolio_value = actual_cash + unrealized_pnl
-        else:
-            # Standard broker
-            portfolio_value = self.broker.getvalue()
+        """Sample standard broker portfolio value for the equity curve"""
+        idx = self._bar_idx
+        values = self._equity_values
+        datenums = self._equity_datenums
+        if idx == len(values):
+            values = self._equity_values = np.concatenate((values, np.empty_like(values)))
+            datenums = self._equity_datenums = np.concatenate((datenums, np.empty_like(datenums)))
+        values[idx] = self.broker.getvalue()
+        datenums[idx] = self.datas[0].datetime[0]
+        self._bar_idx = idx + 1
+
+    def _record_portfolio_state(self):
+        """Record leveraged broker cash and open position after a state change"""
+        if self._track_value_per_bar:
+            return
+        position = self.broker.getposition(self.datas[0])
+        self._portfolio_events.append(
+            (len(self), self._get_actual_cash(), position.size, position.price)
+        )
+
+    def _build_equity_curve(self):
+        """Rebuild the per-bar equity curve (actual cash + unrealized P&L) in one pass"""
+        if self._track_value_per_bar:
+            self.equity_curve = self._equity_values[:self._bar_idx]
+            self.equity_dates = [bt.num2date(dn) for dn in self._equity_datenums[:self._bar_idx]]
+            return
+        if self._first_next_bar is None:
+            return
+        
+        last_bar = len(self)
+        n_bars = last_bar - self._first_next_bar + 1
+        bars = np.arange(self._first_next_bar, last_bar + 1)
+        closes = np.asarray(self.dataclose.get(size=n_bars), dtype=np.float64)
+        
+        # Portfolio state in effect at each bar is the latest one recorded at or before it
+        events = np.asarray(self._portfolio_events, dtype=np.float64)
+        state_idx = np.searchsorted(events[:, 0], bars, side='right') - 1
+        cash = events[state_idx, 1]
+        size = events[state_idx, 2]
+        price = events[state_idx, 3]
         
-        # Store portfolio value and date
-        self.equity_curve.append(portfolio_value)
-        self.equity_dates.append(current_date)
\ No newline at end of file
+        self.equity_curve = cash + size * (closes - price)
+        dt_line = self.datas[0].datetime
+        self.equity_dates = [dt_line.datetime(-ago) for ago in range(n_bars - 1, -1, -1)]
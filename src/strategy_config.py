@@ -5,29 +5,33 @@ This module contains all configurable hyperparameters for the mean reversion str
 Parameters can be modified here without changing the core strategy logic.
 """
 
+from types import MappingProxyType
 from typing import Dict, Any
 
 
 class StrategyConfig:
     """
     Configuration class containing all strategy hyperparameters.
+    
+    Sections are read-only mappings; change them through update_config() so the
+    cached backtrader params are invalidated.
     """
     
     # Technical Indicator Parameters
-    BOLLINGER_BANDS = {
+    BOLLINGER_BANDS = MappingProxyType({
         'window': 20,
         'std_dev': 2
-    }
+    })
     
-    VWAP = {
+    VWAP = MappingProxyType({
         'window': 20,
         'std_dev': 2,
         'anchor': 'day',  # 'day', 'week', 'month', 'year'
         'bands_multiplier': 1.0  # Default multiplier for bands width
-    }
+    })
     
     # Symbol-specific VWAP configurations
-    VWAP_SYMBOL_OVERRIDES = {
+    VWAP_SYMBOL_OVERRIDES = MappingProxyType({
         'BTC': {
             'bands_multiplier': 2.0
         },
@@ -35,26 +39,26 @@ class StrategyConfig:
             'bands_multiplier': 2.0
         }
         # Other symbols use default from VWAP config
-    }
+    })
     
     # Risk Management Parameters
-    RISK_MANAGEMENT = {
+    RISK_MANAGEMENT = MappingProxyType({
         'risk_per_position_pct': 1.0,      # Risk 1% of account per position
         'stop_loss_atr_multiplier': 1.2,   # Stop loss = 1.2 * ATR
         'risk_reward_ratio': 2.5,          # Take profit = 2.5 * risk
         'atr_period': 14,                  # ATR calculation period
         'leverage': 100.0                  # Available leverage (100:1 for forex/CFD)
-    }
+    })
     
     # Strategy Logic Parameters
-    ENTRY_CONDITIONS = {
+    ENTRY_CONDITIONS = MappingProxyType({
         'require_reversal_confirmation': True,  # Require price reversal for entry
         'min_volume_threshold': 0,              # Minimum volume for entry (0 = no filter)
         'max_positions': 1                      # Maximum concurrent positions
-    }
+    })
     
     # Market Regime Detection Parameters
-    MARKET_REGIME = {
+    MARKET_REGIME = MappingProxyType({
         'enabled': False,                       # Enable/disable regime filtering
         'adx_period': 14,                      # ADX calculation period
         'volatility_period': 14,               # ATR period for volatility calculation
@@ -64,31 +68,58 @@ class StrategyConfig:
         'adx_moderate_trend_threshold': 20,    # ADX above this = moderate trend
         'volatility_high_threshold': 67,       # Volatility percentile above this = high vol (avoid)
         'volatility_low_threshold': 33         # Volatility percentile below this = low vol (prefer)
-    }
+    })
     
     # Order Lifetime Parameters (in minutes)
-    ORDER_LIFETIME = {
+    ORDER_LIFETIME = MappingProxyType({
         '5m': 360,    # 6 hours for 5-minute timeframe (doubled from 3 hours)
         '15m': 720,   # 12 hours for 15-minute timeframe (doubled from 6 hours)
         '1h': 2880,   # 2 days for 1-hour timeframe (doubled from 1 day)
         'default': 720  # Default to 12 hours (doubled from 6 hours)
-    }
+    })
     
     # Backtest Parameters
-    BACKTEST = {
+    BACKTEST = MappingProxyType({
         'initial_cash': 100000,     # Starting capital
         'commission': 0.001,        # Commission rate (0.1%)
         'slippage': 0.0005         # Slippage rate (0.05%)
-    }
+    })
+    
+    def __init_subclass__(cls, **kwargs):
+        """
+        Merge section overrides declared on a subclass over the inherited sections.
+        
+        A subclass only lists the keys it changes, e.g. RISK_MANAGEMENT = {...};
+        the merged section gets its own frozen copy so it never shares state
+        with the parent class.
+        """
+        super().__init_subclass__(**kwargs)
+        for name, value in list(vars(cls).items()):
+            if name.isupper() and not name.startswith('_') and isinstance(value, dict):
+                inherited = getattr(super(cls, cls), name, {})
+                setattr(cls, name, MappingProxyType({**inherited, **value}))
     
     @classmethod
     def get_backtrader_params(cls) -> Dict[str, Any]:
         """
         Convert configuration to backtrader strategy parameters format.
         
+        The params are built once per config class and cached until update_config()
+        changes a section.
+        
         Returns:
             Dictionary of parameters for backtrader strategy
         """
+        cache = cls.__dict__.get('_PARAMS_CACHE')
+        if cache is None:
+            cache = cls._build_backtrader_params()
+            cls._PARAMS_CACHE = cache
+        # Callers extend the result (e.g. with a timeframe), so hand out a copy
+        return dict(cache)
+    
+    @classmethod
+    def _build_backtrader_params(cls) -> Dict[str, Any]:
+        """Build the backtrader params dictionary from the current sections."""
         return {
             # Bollinger Bands
             'bb_window': cls.BOLLINGER_BANDS['window'],
@@ -116,7 +147,7 @@ class StrategyConfig:
             'regime_min_score': cls.MARKET_REGIME['min_regime_score'],
             
             # Order lifetime
-            'order_lifetime_minutes': cls.ORDER_LIFETIME
+            'order_lifetime_minutes': dict(cls.ORDER_LIFETIME)
         }
     
     @classmethod
@@ -140,10 +171,21 @@ class StrategyConfig:
         for key, value in kwargs.items():
             if hasattr(cls, key.upper()):
                 section = getattr(cls, key.upper())
-                if isinstance(section, dict) and isinstance(value, dict):
-                    section.update(value)
+                if isinstance(section, (dict, MappingProxyType)) and isinstance(value, dict):
+                    setattr(cls, key.upper(), MappingProxyType({**section, **value}))
                 else:
                     setattr(cls, key.upper(), value)
+        cls._invalidate_params_cache()
+    
+    @classmethod
+    def _invalidate_params_cache(cls) -> None:
+        """Drop cached backtrader params for this class and every subclass."""
+        pending = [cls]
+        while pending:
+            klass = pending.pop()
+            if '_PARAMS_CACHE' in klass.__dict__:
+                delattr(klass, '_PARAMS_CACHE')
+            pending.extend(klass.__subclasses__())
     
     @classmethod
     def get_all_config(cls) -> Dict[str, Any]:
@@ -154,12 +196,12 @@ class StrategyConfig:
             Complete configuration dictionary
         """
         return {
-            'bollinger_bands': cls.BOLLINGER_BANDS,
-            'vwap': cls.VWAP,
-            'risk_management': cls.RISK_MANAGEMENT,
-            'entry_conditions': cls.ENTRY_CONDITIONS,
-            'order_lifetime': cls.ORDER_LIFETIME,
-            'backtest': cls.BACKTEST
+            'bollinger_bands': dict(cls.BOLLINGER_BANDS),
+            'vwap': dict(cls.VWAP),
+            'risk_management': dict(cls.RISK_MANAGEMENT),
+            'entry_conditions': dict(cls.ENTRY_CONDITIONS),
+            'order_lifetime': dict(cls.ORDER_LIFETIME),
+            'backtest': dict(cls.BACKTEST)
         }
     
     @classmethod
@@ -186,8 +228,7 @@ class AggressiveConfig(StrategyConfig):
         'risk_per_position_pct': 2.0,      # Risk 2% per position
         'stop_loss_atr_multiplier': 1.0,   # Tighter stop loss
         'risk_reward_ratio': 3.0,          # Higher reward target
-        'atr_period': 10,                  # Shorter ATR period
-        'leverage': 100.0                  # Available leverage (100:1 for forex/CFD)
+        'atr_period': 10                   # Shorter ATR period
     }
     
     BOLLINGER_BANDS = {
@@ -204,8 +245,7 @@ class ConservativeConfig(StrategyConfig):
         'risk_per_position_pct': 0.5,      # Risk 0.5% per position
         'stop_loss_atr_multiplier': 2.0,   # Wider stop loss
         'risk_reward_ratio': 2.0,          # Lower reward target
-        'atr_period': 20,                  # Longer ATR period
-        'leverage': 100.0                  # Available leverage (100:1 for forex/CFD)
+        'atr_period': 20                   # Longer ATR period
     }
     
     BOLLINGER_BANDS = {
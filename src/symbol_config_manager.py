@@ -8,22 +8,51 @@ and configuration parsing.
 """
 
 import json
+import os
 import sys
 import logging
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Iterator, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 # Configure logging for this module
 logger = logging.getLogger(__name__)
 
+# Legacy X format symbols kept for backward compatibility
+_LEGACY_SYMBOL_MAPPINGS = {
+    'GOLDX': 'GOLD',
+    'SILVERX': 'SILVER',
+    'BTCUSDX': 'BTCUSD',
+    'ETHUSDX': 'ETHUSD'
+}
+
+# Config bundles at least this large are stream-parsed when ijson is installed
+_STREAM_PARSE_MIN_BYTES = 1024 * 1024
+
 
 class SymbolConfigManager:
     """Manager class for symbol configurations and format conversions"""
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def convert_symbol_for_fetching(symbol: str) -> str:
         """
         Convert symbol from config format to clean data fetching format
         
+        Results are memoized and interned, so repeated lookups from the live
+        scheduler are a single cache hit.
+        
         Args:
             symbol: Symbol from config (e.g., 'AUDUSD', 'GOLD', 'SILVER' or legacy 'AUDUSDX', 'GOLDX', 'SILVERX')
             
@@ -31,26 +60,19 @@ class SymbolConfigManager:
             Symbol for data fetching (e.g., 'AUDUSD', 'GOLD', 'SILVER')
         """
         # Handle legacy X format for backward compatibility
-        legacy_mappings = {
-            'GOLDX': 'GOLD',
-            'SILVERX': 'SILVER',
-            'BTCUSDX': 'BTCUSD',
-            'ETHUSDX': 'ETHUSD'
-        }
-        
-        if symbol in legacy_mappings:
-            return legacy_mappings[symbol]
+        if symbol in _LEGACY_SYMBOL_MAPPINGS:
+            return sys.intern(_LEGACY_SYMBOL_MAPPINGS[symbol])
         
         # Legacy forex conversion (AUDUSDX -> AUDUSD)
         if symbol.endswith('X') and len(symbol) == 7:
-            return symbol[:-1]
+            return sys.intern(symbol[:-1])
         
         # Remove =X suffix if present (for backward compatibility)
         if symbol.endswith('=X'):
-            return symbol[:-2]
+            return sys.intern(symbol[:-2])
         
         # Return as-is for clean format
-        return symbol
+        return sys.intern(symbol)
     
     @staticmethod
     def load_symbol_configs(config_file_path: str) -> Dict[str, Dict[str, Any]]:
@@ -68,27 +90,16 @@ class SymbolConfigManager:
             Exception: For other configuration loading errors
         """
         try:
-            with open(config_file_path, 'r') as f:
-                configs = json.load(f)
-            
             symbols_config = {}
-            for symbol_key, config in configs.items():
-                # Extract symbol info
-                asset_info = config['ASSET_INFO']
-                symbol = asset_info['symbol']
-                timeframe = asset_info['timeframe']
-                
-                # Convert symbol format for data fetching with special handling
-                fetch_symbol = SymbolConfigManager.convert_symbol_for_fetching(symbol)
-                
-                symbols_config[symbol_key] = {
-                    'symbol': symbol,
-                    'fetch_symbol': fetch_symbol,
-                    'timeframe': timeframe,
-                    'config': config
-                }
-                
-                logger.debug(f"   ✓ {symbol} ({timeframe}) - {fetch_symbol}")
+            for symbol_key, config in SymbolConfigManager._iter_config_items(config_file_path):
+                symbols_config[symbol_key] = SymbolConfigManager._build_symbol_entry(config)
+            
+            # One summary line instead of a log call per symbol
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("   Loaded: %s", ", ".join(
+                    f"{entry['symbol']}({entry['timeframe']})→{entry['fetch_symbol']}"
+                    for entry in symbols_config.values()
+                ))
             
             logger.info(f"✅ Loaded configurations for {len(symbols_config)} symbols")
             return symbols_config
@@ -99,6 +110,51 @@ class SymbolConfigManager:
         except Exception as e:
             logger.error(f"❌ Error loading configurations: {e}")
             raise
+    
+    @staticmethod
+    def _iter_config_items(config_file_path: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Yield (symbol_key, config) pairs from a configuration file
+        
+        Large bundles are streamed with ijson so the raw file and the full parse
+        tree are never held at the same time; smaller files are parsed in one go
+        (with orjson when available).
+        
+        Args:
+            config_file_path: Path to the configuration file
+        """
+        with open(config_file_path, 'rb') as f:
+            if IJSON_AVAILABLE and os.fstat(f.fileno()).st_size >= _STREAM_PARSE_MIN_BYTES:
+                yield from ijson.kvitems(f, '', use_float=True)
+                return
+            raw = f.read()
+        
+        # orjson is an optional, faster drop-in parser for large config bundles
+        configs = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+        yield from configs.items()
+    
+    @staticmethod
+    def _build_symbol_entry(config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the scheduler entry for a single symbol configuration
+        
+        Args:
+            config: Raw configuration for one symbol
+            
+        Returns:
+            Dictionary with symbol, fetch_symbol, timeframe and the raw config
+        """
+        # Extract symbol info
+        asset_info = config['ASSET_INFO']
+        symbol = asset_info['symbol']
+        
+        return {
+            'symbol': symbol,
+            # Convert symbol format for data fetching with special handling
+            'fetch_symbol': SymbolConfigManager.convert_symbol_for_fetching(symbol),
+            'timeframe': asset_info['timeframe'],
+            'config': config
+        }
 
 
 def load_symbol_configs(config_file_path: str) -> Dict[str, Dict[str, Any]]:
@@ -18,6 +18,8 @@ Example: To change EU indices Sunday opening from 23:00 to 22:30:
 Note: Currently all times must be on the hour (integer values).
 """
 
+from collections import namedtuple
+
 # Market opening times (UTC)
 TRADING_HOURS_CONFIG = {
     # Forex markets
@@ -69,8 +71,14 @@ TRADING_HOURS_CONFIG = {
     },
 }
 
+# Immutable trading hours for one asset type
+Hours = namedtuple('Hours', 'sunday_open daily_open friday_close daily_close')
+
+# Every lookup goes through this table, built once from TRADING_HOURS_CONFIG
+_HOURS_NT = {asset_type: Hours(**hours) for asset_type, hours in TRADING_HOURS_CONFIG.items()}
+
 
-def get_trading_hours(asset_type: str = 'forex') -> dict:
+def get_trading_hours(asset_type: str = 'forex') -> Hours:
     """
     Get trading hours configuration for a specific asset type.
     
@@ -78,30 +86,27 @@ def get_trading_hours(asset_type: str = 'forex') -> dict:
         asset_type: Asset type ('forex', 'indices', 'eu_indices', 'crypto', 'commodities')
     
     Returns:
-        Dictionary with trading hours configuration
+        Hours named tuple (sunday_open, daily_open, friday_close, daily_close);
+        use TRADING_HOURS_CONFIG for the mapping form
     """
-    return TRADING_HOURS_CONFIG.get(asset_type, TRADING_HOURS_CONFIG['forex'])
+    return _HOURS_NT.get(asset_type, _HOURS_NT['forex'])
 
 
 def get_sunday_open_hour(asset_type: str = 'forex') -> int:
     """Get Sunday opening hour for an asset type."""
-    config = get_trading_hours(asset_type)
-    return config['sunday_open']
+    return get_trading_hours(asset_type).sunday_open
 
 
 def get_daily_open_hour(asset_type: str = 'forex') -> int:
     """Get daily reopening hour (Mon-Fri) for an asset type."""
-    config = get_trading_hours(asset_type)
-    return config['daily_open']
+    return get_trading_hours(asset_type).daily_open
 
 
 def get_friday_close_hour(asset_type: str = 'forex') -> int:
     """Get Friday closing hour for an asset type."""
-    config = get_trading_hours(asset_type)
-    return config['friday_close']
+    return get_trading_hours(asset_type).friday_close
 
 
 def get_daily_close_hour(asset_type: str = 'forex') -> int:
     """Get daily closure hour (Mon-Fri) for an asset type."""
-    config = get_trading_hours(asset_type)
-    return config['daily_close']
+    return get_trading_hours(asset_type).daily_close
@@ -6,15 +6,69 @@ Provides a unified interface for local filesystem and cloud storage (S3).
 import os
 import pickle
 import json
+import struct
+import time
+from collections import OrderedDict
+from functools import lru_cache
 import pandas as pd
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
 from pathlib import Path
 from datetime import datetime
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import zstandard as zstd
+    ZSTANDARD_AVAILABLE = True
+except ImportError:
+    ZSTANDARD_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Pickles with out-of-band buffers start with this marker, followed by a header of
+# little-endian uint64s: buffer count, each buffer length, then the pickle length.
+# Files without the marker are plain pickles.
+_OOB_PICKLE_MAGIC = b'MRPKL5\x00\x01'
+# Buffers smaller than this stay inside the pickle stream
+_OOB_MIN_BUFFER_BYTES = 64 * 1024
+# Pickle files written by a transport created with compress_pickles=True are a single
+# zstd frame wrapping either layout above; uncompressed files are still read as before
+_ZSTD_FRAME_MAGIC = b'\x28\xb5\x2f\xfd'
+_ZSTD_LEVEL = 3
+# Number of keys LocalTransport remembers as missing
+_EXISTS_CACHE_SIZE = 1024
+# Seconds a missing key is reported as missing without checking the disk again
+_EXISTS_NEGATIVE_TTL = 1.0
+# Seconds a get_info walk is reused; the directory signature alone misses files
+# changed by other processes below the top level
+_INFO_CACHE_TTL = 5.0
+# Memory, as reported by DataFrame.memory_usage(deep=True), of the loaded pickle/CSV
+# DataFrames LocalTransport keeps; larger frames are never cached
+_LOAD_CACHE_MAX_BYTES = 128 * 1024 * 1024
+# Number of loaded files LocalTransport tracks, including ones only read once so far
+_LOAD_CACHE_MAX_KEYS = 1024
+
+
+@lru_cache(maxsize=4096)
+def _resolve_path(base_str: str, key: str) -> Path:
+    """Resolve a transport key to a path under base_str; results are shared across transports."""
+    # Ensure key doesn't try to escape base directory
+    clean_key = key.strip('/').replace('../', '').replace('..\\', '')
+    return Path(base_str) / clean_key
+
 
 class TransportInterface(ABC):
     """Abstract base class for storage transports."""
@@ -64,6 +118,16 @@ class TransportInterface(ABC):
         """Load CSV data as DataFrame."""
         pass
     
+    @abstractmethod
+    def save_dataframe(self, key: str, data: Any) -> bool:
+        """Save DataFrame as Parquet file."""
+        pass
+    
+    @abstractmethod
+    def load_dataframe(self, key: str) -> Optional[Any]:
+        """Load Parquet data as DataFrame."""
+        pass
+    
     @abstractmethod
     def delete(self, key: str) -> bool:
         """Delete file at key."""
@@ -88,20 +152,107 @@ class TransportInterface(ABC):
 class LocalTransport(TransportInterface):
     """Local filesystem transport implementation."""
     
-    def __init__(self, base_dir: Union[str, Path]):
+    def __init__(self, base_dir: Union[str, Path], compress_pickles: bool = False):
+        if compress_pickles and not ZSTANDARD_AVAILABLE:
+            raise ImportError("zstandard is required for compress_pickles. Install with: pip install zstandard")
         self.base_dir = Path(base_dir)
+        # Opt-in, so the file format doesn't depend on which packages are installed
+        self.compress_pickles = compress_pickles
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        self._base_str = str(self.base_dir)
+        # get_info snapshot as (signature, expiry, file entries); the signature combines
+        # the base directory mtime with a counter bumped by every write through this transport
+        self._info_cache = None
+        self._write_generation = 0
+        # Keys recently seen to be missing, mapped to the monotonic time the entry expires
+        self._exists_neg = OrderedDict()
+        # Recently loaded files keyed by (format, key), each mapped to the (mtime_ns, size)
+        # of the file and either None or (private copy of the DataFrame, its memory
+        # use in bytes); most recently used last
+        self._load_cache = OrderedDict()
+        self._load_cache_bytes = 0
         logger.info(f"LocalTransport initialized with directory: {self.base_dir}")
     
     def _get_path(self, key: str) -> Path:
         """Convert key to filesystem path."""
-        # Ensure key doesn't try to escape base directory
-        clean_key = key.strip('/').replace('../', '').replace('..\\', '')
-        return self.base_dir / clean_key
+        return _resolve_path(self._base_str, key)
     
     def exists(self, key: str) -> bool:
         """Check if a file exists at the given key."""
-        return self._get_path(key).exists()
+        now = time.monotonic()
+        expiry = self._exists_neg.get(key)
+        if expiry is not None and expiry > now:
+            return False
+        
+        if not self._get_path(key).exists():
+            self._exists_neg[key] = now + _EXISTS_NEGATIVE_TTL
+            self._exists_neg.move_to_end(key)
+            if len(self._exists_neg) > _EXISTS_CACHE_SIZE:
+                self._exists_neg.popitem(last=False)
+            return False
+        self._exists_neg.pop(key, None)
+        return True
+    
+    def _mark_written(self, key: str) -> None:
+        """Invalidate cached directory info and loaded data after a file was written."""
+        self._write_generation += 1
+        self._exists_neg.pop(key, None)
+        self._forget_loaded(key)
+    
+    def _mark_deleted(self, key: str) -> None:
+        """Invalidate cached directory info and loaded data after a file was removed."""
+        self._write_generation += 1
+        self._forget_loaded(key)
+    
+    def _forget_loaded(self, key: str) -> None:
+        """Drop loaded-data cache entries for key in every format."""
+        for fmt in ('pickle', 'csv'):
+            self._drop_loaded((fmt, key))
+    
+    def _drop_loaded(self, cache_key: tuple) -> None:
+        """Remove one loaded-data cache entry, if present."""
+        cached = self._load_cache.pop(cache_key, None)
+        if cached is not None and cached[1] is not None:
+            self._load_cache_bytes -= cached[1][1]
+    
+    def _cached_load(self, fmt: str, key: str, file_path: Path, read: Callable[[Path], Any]) -> Any:
+        """
+        Return the data at file_path, reusing an earlier load while the file is unchanged.
+        
+        Only DataFrames are cached, since their memory use can be measured and
+        DataFrame.copy() is much cheaper than reading the file again. The first
+        load of a file only records its signature; a repeat load keeps a private
+        copy, and later hits return copies of it, so callers never share frames.
+        """
+        stat = file_path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cache_key = (fmt, key)
+        
+        cached = self._load_cache.get(cache_key)
+        if cached is not None and cached[0] == signature and cached[1] is not None:
+            self._load_cache.move_to_end(cache_key)
+            return cached[1][0].copy()
+        
+        data = read(file_path)
+        repeat = cached is not None and cached[0] == signature
+        self._drop_loaded(cache_key)
+        if not isinstance(data, pd.DataFrame):
+            return data
+        
+        stored = None
+        if repeat:
+            nbytes = int(data.memory_usage(deep=True).sum())
+            if nbytes > _LOAD_CACHE_MAX_BYTES:
+                return data
+            stored = (data.copy(), nbytes)
+            self._load_cache_bytes += nbytes
+        self._load_cache[cache_key] = (signature, stored)
+        
+        while self._load_cache_bytes > _LOAD_CACHE_MAX_BYTES:
+            self._drop_loaded(next(iter(self._load_cache)))
+        if len(self._load_cache) > _LOAD_CACHE_MAX_KEYS:
+            self._drop_loaded(next(iter(self._load_cache)))
+        return data
     
     def save_pickle(self, key: str, data: Any) -> bool:
         """Save data as pickle file."""
@@ -109,9 +260,35 @@ class LocalTransport(TransportInterface):
             file_path = self._get_path(key)
             file_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(file_path, 'wb') as f:
-                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            # Large contiguous buffers (numpy/pandas blocks) are written straight to
+            # the file after the pickle stream instead of being copied into it
+            buffers = []
+            
+            def collect_buffer(buffer):
+                if buffer.raw().nbytes < _OOB_MIN_BUFFER_BYTES:
+                    return True  # keep small buffers in-band
+                buffers.append(buffer.raw())
+                return False
+            
+            payload = pickle.dumps(data, protocol=5, buffer_callback=collect_buffer)
             
+            # Write to a temporary file and swap it in, so a reader never sees a
+            # partially written file
+            tmp_path = file_path.with_name(f'.{file_path.name}.{os.getpid()}.tmp')
+            try:
+                with open(tmp_path, 'wb') as f:
+                    if self.compress_pickles:
+                        compressor = zstd.ZstdCompressor(level=_ZSTD_LEVEL, threads=-1)
+                        with compressor.stream_writer(f, closefd=False) as writer:
+                            self._write_pickle(writer, payload, buffers)
+                    else:
+                        self._write_pickle(f, payload, buffers)
+                os.replace(tmp_path, file_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+            
+            self._mark_written(key)
             logger.debug(f"Saved pickle to {key}")
             return True
         except Exception as e:
@@ -125,15 +302,88 @@ class LocalTransport(TransportInterface):
             if not file_path.exists():
                 return None
                 
-            with open(file_path, 'rb') as f:
-                data = pickle.load(f)
-                
+            data = self._cached_load('pickle', key, file_path, self._read_pickle)
+            
             logger.debug(f"Loaded pickle from {key}")
             return data
         except Exception as e:
             logger.error(f"Error loading pickle from {key}: {e}")
             return None
     
+    @classmethod
+    def _read_pickle(cls, file_path: Path) -> Any:
+        """Read a pickle file in any of the layouts save_pickle writes."""
+        with open(file_path, 'rb') as f:
+            header = f.read(len(_OOB_PICKLE_MAGIC))
+            if header.startswith(_ZSTD_FRAME_MAGIC):
+                f.seek(0)
+                data = cls._load_zstd_pickle(f)
+            elif header == _OOB_PICKLE_MAGIC:
+                # Read into a bytearray so buffers stay writable for the caller and
+                # don't depend on the file after it is closed
+                f.seek(0)
+                contents = bytearray(os.fstat(f.fileno()).st_size)
+                f.readinto(contents)
+                data = cls._load_oob_pickle(memoryview(contents))
+            else:
+                f.seek(0)
+                data = pickle.load(f)
+        return data
+    
+    @staticmethod
+    def _write_pickle(out, payload: bytes, buffers: List[memoryview]) -> None:
+        """Write a pickle stream, followed by its out-of-band buffers if there are any."""
+        if buffers:
+            out.write(_OOB_PICKLE_MAGIC)
+            out.write(struct.pack(f'<{len(buffers) + 1}Q', len(buffers),
+                                  *(buffer.nbytes for buffer in buffers)))
+            out.write(struct.pack('<Q', len(payload)))
+            out.write(payload)
+            for buffer in buffers:
+                out.write(buffer)
+        else:
+            out.write(payload)
+    
+    @classmethod
+    def _load_zstd_pickle(cls, f) -> Any:
+        """Decompress a zstd-framed pickle file and load it."""
+        if not ZSTANDARD_AVAILABLE:
+            raise ImportError("zstandard is required to read compressed pickle files")
+        
+        # Decompress into a bytearray so out-of-band buffers stay writable for the caller
+        data = bytearray()
+        reader = zstd.ZstdDecompressor().stream_reader(f, closefd=False)
+        while True:
+            chunk = reader.read(1 << 20)
+            if not chunk:
+                break
+            data += chunk
+        
+        if data.startswith(_OOB_PICKLE_MAGIC):
+            return cls._load_oob_pickle(memoryview(data))
+        return pickle.loads(data)
+    
+    @staticmethod
+    def _load_oob_pickle(mapped: memoryview) -> Any:
+        """Load a pickle written with out-of-band buffers, slicing the buffers from the file contents."""
+        offset = len(_OOB_PICKLE_MAGIC)
+        
+        (buffer_count,) = struct.unpack_from('<Q', mapped, offset)
+        offset += 8
+        buffer_lengths = struct.unpack_from(f'<{buffer_count}Q', mapped, offset)
+        offset += 8 * buffer_count
+        (payload_length,) = struct.unpack_from('<Q', mapped, offset)
+        offset += 8
+        
+        payload = mapped[offset:offset + payload_length]
+        offset += payload_length
+        buffers = []
+        for length in buffer_lengths:
+            buffers.append(mapped[offset:offset + length])
+            offset += length
+        
+        return pickle.loads(payload, buffers=buffers)
+    
     def save_text(self, key: str, content: str) -> bool:
         """Save text content to key."""
         try:
@@ -143,6 +393,7 @@ class LocalTransport(TransportInterface):
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.write(content)
             
+            self._mark_written(key)
             logger.debug(f"Saved text to {key}")
             return True
         except Exception as e:
@@ -171,9 +422,12 @@ class LocalTransport(TransportInterface):
             file_path = self._get_path(key)
             file_path.parent.mkdir(parents=True, exist_ok=True)
             
+            # Written with the stdlib even when orjson is installed: orjson turns
+            # NaN/inf into null, while metrics files rely on NaN round-tripping
             with open(file_path, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, default=str)
             
+            self._mark_written(key)
             logger.debug(f"Saved JSON to {key}")
             return True
         except Exception as e:
@@ -187,8 +441,7 @@ class LocalTransport(TransportInterface):
             if not file_path.exists():
                 return None
                 
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self._read_json(file_path)
                 
             logger.debug(f"Loaded JSON from {key}")
             return data
@@ -196,6 +449,20 @@ class LocalTransport(TransportInterface):
             logger.error(f"Error loading JSON from {key}: {e}")
             return None
     
+    @staticmethod
+    def _read_json(file_path: Path) -> Any:
+        """Read a JSON file, preferring orjson when installed."""
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # Older files may contain NaN/Infinity, which only the stdlib parser accepts
+                return json.loads(raw)
+        return json.loads(raw)
+    
     def save_csv(self, key: str, data: pd.DataFrame) -> bool:
         """Save DataFrame as CSV file."""
         try:
@@ -204,6 +471,7 @@ class LocalTransport(TransportInterface):
             
             data.to_csv(file_path, index=False)
             
+            self._mark_written(key)
             logger.debug(f"Saved CSV to {key}")
             return True
         except Exception as e:
@@ -217,7 +485,7 @@ class LocalTransport(TransportInterface):
             if not file_path.exists():
                 return None
                 
-            data = pd.read_csv(file_path)
+            data = self._cached_load('csv', key, file_path, pd.read_csv)
             
             logger.debug(f"Loaded CSV from {key}")
             return data
@@ -225,12 +493,49 @@ class LocalTransport(TransportInterface):
             logger.error(f"Error loading CSV from {key}: {e}")
             return None
     
+    def save_dataframe(self, key: str, data: pd.DataFrame) -> bool:
+        """Save DataFrame as Parquet file."""
+        if not PYARROW_AVAILABLE:
+            logger.error(f"Error saving Parquet to {key}: pyarrow is required. Install with: pip install pyarrow")
+            return False
+        try:
+            file_path = self._get_path(key)
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            pq.write_table(pa.Table.from_pandas(data), file_path, compression='zstd')
+            
+            self._mark_written(key)
+            logger.debug(f"Saved Parquet to {key}")
+            return True
+        except Exception as e:
+            logger.error(f"Error saving Parquet to {key}: {e}")
+            return False
+    
+    def load_dataframe(self, key: str) -> Optional[pd.DataFrame]:
+        """Load Parquet data as DataFrame."""
+        if not PYARROW_AVAILABLE:
+            logger.error(f"Error loading Parquet from {key}: pyarrow is required. Install with: pip install pyarrow")
+            return None
+        try:
+            file_path = self._get_path(key)
+            if not file_path.exists():
+                return None
+            
+            data = pq.read_table(file_path).to_pandas()
+            
+            logger.debug(f"Loaded Parquet from {key}")
+            return data
+        except Exception as e:
+            logger.error(f"Error loading Parquet from {key}: {e}")
+            return None
+    
     def delete(self, key: str) -> bool:
         """Delete file at key."""
         try:
             file_path = self._get_path(key)
             if file_path.exists():
                 file_path.unlink()
+                self._mark_deleted(key)
                 logger.debug(f"Deleted {key}")
                 return True
             return False
@@ -238,6 +543,19 @@ class LocalTransport(TransportInterface):
             logger.error(f"Error deleting {key}: {e}")
             return False
     
+    def _walk(self, dirpath: Union[str, Path]) -> Iterator[os.DirEntry]:
+        """Yield every file below dirpath, without following directory symlinks."""
+        with os.scandir(dirpath) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from self._walk(entry.path)
+                elif entry.is_file():
+                    yield entry
+    
+    def _entry_key(self, entry: os.DirEntry) -> str:
+        """Convert a walked directory entry back to its transport key."""
+        return entry.path[len(self._base_str) + 1:].replace(os.sep, '/')
+    
     def list_keys(self, prefix: str = "") -> List[str]:
         """List all keys with given prefix."""
         try:
@@ -248,11 +566,9 @@ class LocalTransport(TransportInterface):
                 return [prefix] if prefix else []
             
             if search_path.is_dir():
-                for file_path in search_path.rglob('*'):
-                    if file_path.is_file():
-                        # Convert back to relative key
-                        relative_path = file_path.relative_to(self.base_dir)
-                        keys.append(str(relative_path).replace('\\', '/'))
+                for entry in self._walk(search_path):
+                    # Convert back to relative key
+                    keys.append(self._entry_key(entry))
             
             return sorted(keys)
         except Exception as e:
@@ -262,31 +578,36 @@ class LocalTransport(TransportInterface):
     def get_info(self) -> Dict[str, Any]:
         """Get transport information (size, file count, etc.)."""
         try:
+            signature = (self.base_dir.stat().st_mtime, self._write_generation)
+            now_monotonic = time.monotonic()
+            if (self._info_cache is not None and self._info_cache[0] == signature
+                    and self._info_cache[1] > now_monotonic):
+                entries = self._info_cache[2]
+            else:
+                entries = []
+                for entry in self._walk(self.base_dir):
+                    stat = entry.stat()
+                    entries.append((self._entry_key(entry), stat.st_size, stat.st_mtime))
+                self._info_cache = (signature, now_monotonic + _INFO_CACHE_TTL, entries)
+            
+            # Ages are relative to now, so they are recomputed even for a cached walk
+            now = datetime.now()
             total_size = 0
-            total_files = 0
             files_info = []
-            
-            for file_path in self.base_dir.rglob('*'):
-                if file_path.is_file():
-                    total_files += 1
-                    size = file_path.stat().st_size
-                    total_size += size
-                    
-                    # Get file age
-                    modified_time = datetime.fromtimestamp(file_path.stat().st_mtime)
-                    age_hours = (datetime.now() - modified_time).total_seconds() / 3600
-                    
-                    files_info.append({
-                        'key': str(file_path.relative_to(self.base_dir)).replace('\\', '/'),
-                        'size_bytes': size,
-                        'age_hours': age_hours,
-                        'modified_time': modified_time.isoformat()
-                    })
+            for key, size, mtime in entries:
+                total_size += size
+                modified_time = datetime.fromtimestamp(mtime)
+                files_info.append({
+                    'key': key,
+                    'size_bytes': size,
+                    'age_hours': (now - modified_time).total_seconds() / 3600,
+                    'modified_time': modified_time.isoformat()
+                })
             
             return {
                 'transport_type': 'local',
                 'base_directory': str(self.base_dir),
-                'total_files': total_files,
+                'total_files': len(entries),
                 'total_size_bytes': total_size,
                 'total_size_mb': total_size / (1024 * 1024),
                 'files': files_info
@@ -301,15 +622,16 @@ class LocalTransport(TransportInterface):
             deleted_count = 0
             cutoff_time = datetime.now().timestamp() - (max_age_days * 24 * 3600)
             
-            for file_path in self.base_dir.rglob('*'):
-                if file_path.is_file() and file_path.stat().st_mtime < cutoff_time:
+            for entry in self._walk(self.base_dir):
+                if entry.stat().st_mtime < cutoff_time:
                     try:
-                        file_path.unlink()
+                        os.unlink(entry.path)
+                        self._mark_deleted(self._entry_key(entry))
                         deleted_count += 1
-                        logger.debug(f"Deleted old file: {file_path}")
                     except Exception as e:
-                        logger.error(f"Error deleting file {file_path}: {e}")
+                        logger.error(f"Error deleting file {entry.path}: {e}")
             
+            logger.info(f"Cleanup deleted {deleted_count} files older than {max_age_days} days from {self.base_dir}")
             return deleted_count
         except Exception as e:
             logger.error(f"Error during cleanup: {e}")
@@ -3,7 +3,7 @@ Transport factory for creating appropriate transport instances based on configur
 """
 
 import os
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from pathlib import Path
 import logging
 
@@ -12,53 +12,107 @@ from .s3_transport import S3Transport
 
 logger = logging.getLogger(__name__)
 
+# Transports already built: local ones keyed by resolved directory, S3 ones by
+# bucket, prefix and client configuration, so each location has one instance
+_TRANSPORTS: Dict[Tuple, TransportInterface] = {}
 
-def create_cache_transport(base_dir: Optional[str] = None, transport_type: Optional[str] = None) -> TransportInterface:
-    """
-    Create cache transport based on transport_type parameter or CACHE_TRANSPORT environment variable.
-    
-    Args:
-        base_dir: Base directory for local transport (optional)
-        transport_type: Transport type ('local' or 's3'). If None, uses CACHE_TRANSPORT env var.
+
+# S3 client shared by every S3 transport, with the (key id, secret, region) it was built for
+_shared_s3_client = None
+_shared_s3_client_config: Optional[Tuple] = None
+
+
+def clear_transport_cache() -> None:
+    """Forget all transports built by the factory functions, and the shared S3 client."""
+    global _shared_s3_client, _shared_s3_client_config
+    _TRANSPORTS.clear()
+    _shared_s3_client = None
+    _shared_s3_client_config = None
+
+
+def _get_s3_client():
+    """Return the shared S3 client, building its boto3 session once per AWS configuration."""
+    global _shared_s3_client, _shared_s3_client_config
+    config = (os.getenv('AWS_ACCESS_KEY_ID'), os.getenv('AWS_SECRET_ACCESS_KEY'),
+              os.getenv('AWS_REGION', 'us-east-1'))
+    if _shared_s3_client is None or _shared_s3_client_config != config:
+        session = S3Transport.create_session(*config)
+        _shared_s3_client = session.client('s3')
+        _shared_s3_client_config = config
+    return _shared_s3_client
+
+
+# Per transport kind: (environment variable selecting the transport type,
+# S3 sub-prefix, default local directory under the project root)
+_KINDS = {
+    'cache': ('CACHE_TRANSPORT', 'cache/', 'cache'),
+    'log': ('LOG_TRANSPORT', 'logs/', 'optimization'),
+    'optimization': ('LOG_TRANSPORT', 'optimization/', 'optimization'),
+}
+
+
+def _create_transport(kind: str, base_dir: Optional[str] = None, transport_type: Optional[str] = None) -> TransportInterface:
+    """Return the transport of the given kind, reusing the one already built for its location."""
+    env_var, sub_prefix, default_dir = _KINDS[kind]
     
-    Returns:
-        TransportInterface: Configured transport instance
-    """
     if transport_type is None:
-        transport_type = os.getenv('CACHE_TRANSPORT', 'local')
+        transport_type = os.getenv(env_var, 'local')
     transport_type = transport_type.lower()
     
     if transport_type == 's3':
         # S3 configuration
         bucket = os.getenv('AWS_S3_BUCKET')
         if not bucket:
-            logger.warning("AWS_S3_BUCKET not set, falling back to local cache transport")
+            logger.warning(f"AWS_S3_BUCKET not set, falling back to local {kind} transport")
             transport_type = 'local'
         else:
             prefix = os.getenv('AWS_S3_PREFIX', 'mean-reversion-strat/')
             if not prefix.endswith('/'):
                 prefix += '/'
-            prefix += 'cache/'
+            prefix += sub_prefix
             
             try:
-                return S3Transport(
-                    bucket_name=bucket,
-                    prefix=prefix,
-                    aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-                    aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-                    region_name=os.getenv('AWS_REGION', 'us-east-1')
-                )
+                s3_client = _get_s3_client()
+                key = ('s3', bucket, prefix, _shared_s3_client_config)
+                transport = _TRANSPORTS.get(key)
+                if transport is None:
+                    transport = _TRANSPORTS[key] = S3Transport(
+                        bucket_name=bucket,
+                        prefix=prefix,
+                        s3_client=s3_client
+                    )
+                return transport
             except Exception as e:
-                logger.error(f"Failed to create S3 cache transport: {e}")
-                logger.warning("Falling back to local cache transport")
+                # Nothing is cached on failure, so the next call retries S3
+                logger.error(f"Failed to create S3 {kind} transport: {e}")
+                logger.warning(f"Falling back to local {kind} transport")
                 transport_type = 'local'
     
     # Default to local transport
     if base_dir is None:
         project_root = Path(__file__).parent.parent
-        base_dir = project_root / 'cache'
+        base_dir = project_root / default_dir
     
-    return LocalTransport(base_dir)
+    # Kinds sharing a directory share a transport, so their caches see each other's writes
+    key = ('local', str(Path(base_dir).resolve()))
+    transport = _TRANSPORTS.get(key)
+    if transport is None:
+        transport = _TRANSPORTS[key] = LocalTransport(base_dir)
+    return transport
+
+
+def create_cache_transport(base_dir: Optional[str] = None, transport_type: Optional[str] = None) -> TransportInterface:
+    """
+    Create cache transport based on transport_type parameter or CACHE_TRANSPORT environment variable.
+    
+    Args:
+        base_dir: Base directory for local transport (optional)
+        transport_type: Transport type ('local' or 's3'). If None, uses CACHE_TRANSPORT env var.
+    
+    Returns:
+        TransportInterface: Configured transport instance
+    """
+    return _create_transport('cache', base_dir, transport_type)
 
 
 def create_log_transport(base_dir: Optional[str] = None, transport_type: Optional[str] = None) -> TransportInterface:
@@ -72,41 +126,7 @@ def create_log_transport(base_dir: Optional[str] = None, transport_type: Optiona
     Returns:
         TransportInterface: Configured transport instance
     """
-    if transport_type is None:
-        transport_type = os.getenv('LOG_TRANSPORT', 'local')
-    transport_type = transport_type.lower()
-    
-    if transport_type == 's3':
-        # S3 configuration
-        bucket = os.getenv('AWS_S3_BUCKET')
-        if not bucket:
-            logger.warning("AWS_S3_BUCKET not set, falling back to local log transport")
-            transport_type = 'local'
-        else:
-            prefix = os.getenv('AWS_S3_PREFIX', 'mean-reversion-strat/')
-            if not prefix.endswith('/'):
-                prefix += '/'
-            prefix += 'logs/'
-            
-            try:
-                return S3Transport(
-                    bucket_name=bucket,
-                    prefix=prefix,
-                    aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-                    aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-                    region_name=os.getenv('AWS_REGION', 'us-east-1')
-                )
-            except Exception as e:
-                logger.error(f"Failed to create S3 log transport: {e}")
-                logger.warning("Falling back to local log transport")
-                transport_type = 'local'
-    
-    # Default to local transport
-    if base_dir is None:
-        project_root = Path(__file__).parent.parent
-        base_dir = project_root / 'optimization'
-    
-    return LocalTransport(base_dir)
+    return _create_transport('log', base_dir, transport_type)
 
 
 def create_optimization_transport(optimization_dir: Optional[str] = None, transport_type: Optional[str] = None) -> TransportInterface:
@@ -120,38 +140,4 @@ def create_optimization_transport(optimization_dir: Optional[str] = None, transp
     Returns:
         TransportInterface: Configured transport instance
     """
-    if transport_type is None:
-        transport_type = os.getenv('LOG_TRANSPORT', 'local')
-    transport_type = transport_type.lower()
-    
-    if transport_type == 's3':
-        # S3 configuration
-        bucket = os.getenv('AWS_S3_BUCKET')
-        if not bucket:
-            logger.warning("AWS_S3_BUCKET not set, falling back to local optimization transport")
-            transport_type = 'local'
-        else:
-            prefix = os.getenv('AWS_S3_PREFIX', 'mean-reversion-strat/')
-            if not prefix.endswith('/'):
-                prefix += '/'
-            prefix += 'optimization/'
-            
-            try:
-                return S3Transport(
-                    bucket_name=bucket,
-                    prefix=prefix,
-                    aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-                    aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-                    region_name=os.getenv('AWS_REGION', 'us-east-1')
-                )
-            except Exception as e:
-                logger.error(f"Failed to create S3 optimization transport: {e}")
-                logger.warning("Falling back to local optimization transport")
-                transport_type = 'local'
-    
-    # Default to local transport
-    if optimization_dir is None:
-        project_root = Path(__file__).parent.parent
-        optimization_dir = project_root / 'optimization'
-    
-    return LocalTransport(optimization_dir)
+    return _create_transport('optimization', optimization_dir, transport_type)
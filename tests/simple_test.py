@@ -10,6 +10,9 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  #
 import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend
 import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 import pandas as pd
 import numpy as np
 from src.data_fetcher import DataFetcher
@@ -47,11 +50,24 @@ def simple_test():
         plot_vwap = vwap.tail(100)
         plot_bb_ma = bb_ma.tail(100)
         
-        ax.plot(plot_data.index, plot_data['close'], label='Close', color='black')
-        ax.plot(plot_data.index, plot_vwap, label='VWAP', color='red', linewidth=2)
-        ax.plot(plot_data.index, plot_bb_ma, label='BB MA', color='blue')
+        # Draw all series as one collection instead of one Line2D artist per series
+        x = mdates.date2num(plot_data.index.to_pydatetime())
+        series = [
+            ('Close', plot_data['close'], 'black', 1.5),
+            ('VWAP', plot_vwap, 'red', 2),
+            ('BB MA', plot_bb_ma, 'blue', 1.5),
+        ]
+        lines = LineCollection(
+            [np.column_stack([x, values.to_numpy()]) for _, values, _, _ in series],
+            colors=[color for _, _, color, _ in series],
+            linewidths=[width for _, _, _, width in series]
+        )
+        ax.add_collection(lines)
+        ax.autoscale()
+        ax.xaxis_date()
         
-        ax.legend()
+        ax.legend(handles=[Line2D([], [], color=color, linewidth=width, label=label)
+                           for label, _, color, width in series])
         ax.set_title('Price with VWAP and BB MA (Last 100 periods)')
         ax.grid(True, alpha=0.3)
         
@@ -10,40 +10,44 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  #
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from functools import lru_cache
 from src.indicators import Indicators
 
-def create_multi_period_test_data():
-    """Create test data spanning multiple weeks/months for testing different anchor periods"""
+@lru_cache(maxsize=1)
+def _build_multi_period_test_data():
+    """Generate the seeded multi-period OHLCV frame (cached, do not mutate)"""
     # Create 60 days of hourly data (covers multiple weeks and months)
     dates = pd.date_range(start='2024-01-01 00:00:00', end='2024-03-01 23:00:00', freq='1h')
     
-    np.random.seed(42)
-    base_price = 100.0
-    data = []
+    rng = np.random.default_rng(42)
+    n = len(dates)
     
-    for i, date in enumerate(dates):
-        # Create smooth trending price with some volatility
-        daily_trend = 0.01 * np.sin(i / (24 * 7) * 2 * np.pi)  # Weekly trend cycle
-        price_change = np.random.normal(daily_trend, 0.15)
-        open_price = base_price + price_change
-        
-        high = open_price + abs(np.random.normal(0, 0.08))
-        low = open_price - abs(np.random.normal(0, 0.08))
-        close = open_price + np.random.normal(0, 0.08)
-        volume = np.random.uniform(1000, 3000)
-        
-        data.append({
-            'open': open_price,
-            'high': high,
-            'low': low,
-            'close': close,
-            'volume': volume
-        })
-        
-        base_price = close
+    # Smooth trending price with some volatility; each bar opens from the previous close
+    daily_trend = 0.01 * np.sin(np.arange(n) / (24 * 7) * 2 * np.pi)  # Weekly trend cycle
+    price_change = daily_trend + rng.standard_normal(n) * 0.15
+    high_offset = np.abs(rng.standard_normal(n)) * 0.08
+    low_offset = np.abs(rng.standard_normal(n)) * 0.08
+    close_change = rng.standard_normal(n) * 0.08
+    volume = rng.uniform(1000, 3000, n)
+    
+    close = 100.0 + np.cumsum(price_change + close_change)
+    open_price = close - close_change
+    
+    data = {
+        'open': open_price,
+        'high': open_price + high_offset,
+        'low': open_price - low_offset,
+        'close': close,
+        'volume': volume
+    }
     
     return pd.DataFrame(data, index=dates)
 
+def create_multi_period_test_data():
+    """Create test data spanning multiple weeks/months for testing different anchor periods"""
+    # Generated once per run; callers get their own copy so mutations don't leak
+    return _build_multi_period_test_data().copy()
+
 def test_anchor_periods():
     """Test VWAP with different anchor periods"""
     print("=== VWAP Anchor Period Test ===")
@@ -56,18 +60,30 @@ def test_anchor_periods():
     anchor_periods = ['day', 'week', 'month', 'year']
     results = {}
     
+    # Compute all anchors in one call so typical price is shared between them
+    try:
+        all_vwaps = Indicators.vwap_multi_anchor(df, anchor_periods, num_std=1.0)
+    except Exception as e:
+        print(f"✗ Multi-anchor VWAP failed: {e}")
+        return results
+    
     for period in anchor_periods:
         try:
             print(f"\nTesting anchor period: {period}")
-            vwap, upper, lower = Indicators.vwap_daily_reset(df, num_std=1.0, anchor_period=period)
-            results[period] = {'vwap': vwap, 'upper': upper, 'lower': lower}
+            vwap, upper, lower = all_vwaps[period]
+            # Reductions are computed once and kept with the series for later analysis
+            vwap_std = float(vwap.std())
+            vwap_diff = vwap.diff().abs().to_numpy()
+            results[period] = {
+                'vwap': vwap, 'upper': upper, 'lower': lower,
+                'std': vwap_std, 'diff': vwap_diff
+            }
             print(f"✓ {period.capitalize()} anchor successful")
             print(f"  VWAP range: {vwap.min():.2f} - {vwap.max():.2f}")
             
             # Count number of resets (by checking where VWAP jumps significantly)
-            vwap_diff = vwap.diff().abs()
-            reset_threshold = vwap.std() * 0.5  # Threshold for detecting resets
-            num_resets = (vwap_diff > reset_threshold).sum()
+            reset_threshold = vwap_std * 0.5  # Threshold for detecting resets
+            num_resets = int((vwap_diff > reset_threshold).sum())
             print(f"  Estimated resets: {num_resets}")
             
         except Exception as e:
@@ -75,84 +91,65 @@ def test_anchor_periods():
     
     return results
 
+def count_period_resets(typical_price, vwap, period_keys):
+    """Count periods whose first VWAP value equals the first bar's typical price"""
+    # Rows are time ordered, so the first occurrence of each key opens its period
+    first_rows = ~pd.Index(period_keys).duplicated()
+    resets = np.abs(vwap[first_rows] - typical_price[first_rows]) < 0.001
+    return int(resets.sum()), int(first_rows.sum())
+
 def analyze_reset_behavior(df, results):
     """Analyze reset behavior for different anchor periods"""
     print(f"\n=== Reset Behavior Analysis ===")
     
+    # Typical price is the same for every anchor period, compute it once
+    typical_price = ((df['high'] + df['low'] + df['close']) / 3).to_numpy()
+    
     for period, data in results.items():
-        vwap = data['vwap']
+        vwap = data['vwap'].to_numpy()
         
         print(f"\n{period.upper()} Anchor Period:")
         
-        # Show first few values to see reset behavior
+        # Show first few values to see reset behavior (positional array reads)
         print("First 5 values:")
         for i in range(min(5, len(vwap))):
             idx = df.index[i]
-            typical_price = (df.loc[idx, 'high'] + df.loc[idx, 'low'] + df.loc[idx, 'close']) / 3
-            print(f"  {idx.strftime('%Y-%m-%d %H:%M')}: VWAP = {vwap.iloc[i]:.3f}, TP = {typical_price:.3f}")
+            print(f"  {idx.strftime('%Y-%m-%d %H:%M')}: VWAP = {vwap[i]:.3f}, TP = {typical_price[i]:.3f}")
         
         # Analyze period boundaries
         if period == 'day':
             # Check daily resets
-            df_temp = df.copy()
-            df_temp['vwap'] = vwap
-            df_temp['date'] = df_temp.index.date
-            
-            reset_count = 0
-            for date, day_data in df_temp.groupby('date'):
-                first_vwap = day_data['vwap'].iloc[0]
-                first_tp = (day_data['high'].iloc[0] + day_data['low'].iloc[0] + day_data['close'].iloc[0]) / 3
-                if abs(first_vwap - first_tp) < 0.001:
-                    reset_count += 1
-            
-            print(f"  Perfect daily resets: {reset_count}/{len(df_temp.groupby('date'))}")
+            reset_count, num_days = count_period_resets(typical_price, vwap, df.index.date)
+            print(f"  Perfect daily resets: {reset_count}/{num_days}")
         
         elif period == 'week':
             # Check weekly resets
-            df_temp = df.copy()
-            df_temp['vwap'] = vwap
-            df_temp['week'] = df_temp.index.to_series().apply(
-                lambda x: f"{x.isocalendar().year}-W{x.isocalendar().week:02d}"
-            )
-            
-            reset_count = 0
-            for week, week_data in df_temp.groupby('week'):
-                first_vwap = week_data['vwap'].iloc[0]
-                first_tp = (week_data['high'].iloc[0] + week_data['low'].iloc[0] + week_data['close'].iloc[0]) / 3
-                if abs(first_vwap - first_tp) < 0.001:
-                    reset_count += 1
-            
-            print(f"  Perfect weekly resets: {reset_count}/{len(df_temp.groupby('week'))}")
+            iso = df.index.isocalendar()
+            week_keys = iso['year'] * 100 + iso['week']  # ISO year-week as one integer
+            reset_count, num_weeks = count_period_resets(typical_price, vwap, week_keys)
+            print(f"  Perfect weekly resets: {reset_count}/{num_weeks}")
 
 def compare_anchor_periods(results):
     """Compare VWAP values across different anchor periods"""
     print(f"\n=== Anchor Period Comparison ===")
     
-    # Create comparison table for first 24 hours
-    comparison_data = []
-    for i in range(min(24, len(next(iter(results.values()))['vwap']))):
-        row = {'hour': i}
-        for period, data in results.items():
-            row[f'{period}_vwap'] = data['vwap'].iloc[i]
-        comparison_data.append(row)
-    
-    comparison_df = pd.DataFrame(comparison_data)
+    # Comparison table for the first hours, read straight from the VWAP arrays
+    first_hours = {period: data['vwap'].to_numpy()[:12] for period, data in results.items()}
     
     print("VWAP Values for First 24 Hours:")
     print("Hour | Day    | Week   | Month  | Year")
     print("-" * 40)
-    for _, row in comparison_df.head(12).iterrows():  # Show first 12 hours
-        print(f"{int(row['hour']):4d} | {row['day_vwap']:6.2f} | {row['week_vwap']:6.2f} | {row['month_vwap']:6.2f} | {row['year_vwap']:6.2f}")
+    for i in range(len(first_hours['day'])):  # Show first 12 hours
+        print(f"{i:4d} | {first_hours['day'][i]:6.2f} | {first_hours['week'][i]:6.2f} | {first_hours['month'][i]:6.2f} | {first_hours['year'][i]:6.2f}")
     
     # Calculate correlations
     print(f"\nCorrelations between anchor periods:")
     periods = list(results.keys())
+    # All series share the same index, so one corrcoef call gives every pair
+    corr = np.corrcoef(np.stack([results[period]['vwap'].to_numpy() for period in periods]))
     for i, period1 in enumerate(periods):
-        for period2 in periods[i+1:]:
-            vwap1 = results[period1]['vwap']
-            vwap2 = results[period2]['vwap']
-            corr = vwap1.corr(vwap2)
-            print(f"  {period1} vs {period2}: {corr:.3f}")
+        for j in range(i + 1, len(periods)):
+            print(f"  {period1} vs {periods[j]}: {corr[i, j]:.3f}")
 
 def test_invalid_anchor_period():
     """Test error handling for invalid anchor periods"""
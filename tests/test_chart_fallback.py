@@ -32,12 +32,16 @@ try:
     
     # Create minimal test data
     dates = pd.date_range(end=datetime.now(), periods=100, freq='5min')
+    rng = np.random.default_rng()
+    z = rng.standard_normal((4, 100))  # one draw for open, close, high and low offsets
+    open_prices = z[0] + 100
+    close_prices = z[1] + 100
     data = pd.DataFrame({
-        'open': np.random.randn(100) + 100,
-        'high': np.random.randn(100) + 101,
-        'low': np.random.randn(100) + 99,
-        'close': np.random.randn(100) + 100,
-        'volume': np.random.randint(1000, 10000, 100)
+        'open': open_prices,
+        'high': np.maximum(np.maximum(open_prices, close_prices), z[2] + 101),
+        'low': np.minimum(np.minimum(open_prices, close_prices), z[3] + 99),
+        'close': close_prices,
+        'volume': rng.integers(1000, 10000, 100)
     }, index=dates)
     
     signal_data = {
@@ -53,7 +57,8 @@ try:
         'vwap_std': 2
     }
     
-    result = generator.generate_signal_chart(data, signal_data, strategy_params, 'TEST')
+    result = generator.generate_signal_chart(data, signal_data, strategy_params, symbol='TEST',
+                                              png_compress_level=1)
     
     if result:
         print(f"✅ Chart generated: {len(result)} bytes")
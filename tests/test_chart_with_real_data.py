@@ -181,7 +181,8 @@ def test_chart_generation_with_real_data():
         data=data,
         signal_data=signal_data,
         strategy_params=strategy_params,
-        symbol='EURUSD'
+        symbol='EURUSD',
+        png_compress_level=1
     )
     
     if chart_buffer:
@@ -254,7 +255,8 @@ def test_chart_with_different_signals():
             data=data,
             signal_data=signal_data,
             strategy_params=strategy_params,
-            symbol='EURUSD'
+            symbol='EURUSD',
+            png_compress_level=1
         )
         
         if chart_buffer:
@@ -6,6 +6,7 @@ Tests both local and S3 transports if configured.
 
 import os
 import sys
+import pickle
 import tempfile
 from pathlib import Path
 from datetime import datetime
@@ -20,9 +21,10 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
-from src.transport import LocalTransport
+import src.transport as transport_module
+from src.transport import LocalTransport, PYARROW_AVAILABLE
 from src.data_cache import DataCache
-from src.transport_factory import create_cache_transport, create_optimization_transport
+from src.transport_factory import create_cache_transport, create_log_transport, create_optimization_transport, clear_transport_cache
 
 def test_local_transport():
     """Test local transport functionality"""
@@ -61,6 +63,18 @@ def test_local_transport():
         loaded_df = transport.load_pickle(pickle_key)
         assert len(loaded_df) == len(test_df), "DataFrame length mismatch"
         
+        # Test Parquet operations (pyarrow is optional)
+        if PYARROW_AVAILABLE:
+            parquet_key = "test/dataframe.parquet"
+            assert transport.save_dataframe(parquet_key, test_df), "Failed to save Parquet"
+            loaded_parquet = transport.load_dataframe(parquet_key)
+            assert loaded_parquet.equals(test_df), "Parquet DataFrame mismatch"
+            
+            indexed_df = test_df.set_index('date')
+            assert transport.save_dataframe(parquet_key, indexed_df), "Failed to save indexed Parquet"
+            loaded_parquet = transport.load_dataframe(parquet_key)
+            assert loaded_parquet.equals(indexed_df), "Parquet DataFrame lost its index"
+        
         # Test list operations
         keys = transport.list_keys("test/")
         assert len(keys) >= 3, f"Expected at least 3 keys, got {len(keys)}"
@@ -72,6 +86,73 @@ def test_local_transport():
         
         print("✅ Local transport tests passed!")
 
+def test_pickle_formats():
+    """Test the pickle layouts LocalTransport reads and writes"""
+    print("🔍 Testing Pickle File Formats...")
+    
+    # Large enough for its column blocks to be written as out-of-band buffers
+    large_df = pd.DataFrame({
+        'price': [x * 0.5 for x in range(20000)],
+        'volume': range(20000)
+    }, index=pd.date_range('2023-01-01', periods=20000, freq='min'))
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        transport = LocalTransport(temp_dir)
+        
+        # Files written with a plain pickle.dump before the out-of-band layout
+        legacy_path = Path(temp_dir) / "legacy.pkl"
+        with open(legacy_path, 'wb') as f:
+            pickle.dump(large_df, f)
+        pd.testing.assert_frame_equal(transport.load_pickle("legacy.pkl"), large_df)
+        
+        # Uncompressed layout, as written when zstandard is not installed
+        zstd_available = transport_module.ZSTANDARD_AVAILABLE
+        transport_module.ZSTANDARD_AVAILABLE = False
+        try:
+            try:
+                LocalTransport(temp_dir, compress_pickles=True)
+                assert False, "compress_pickles should require zstandard"
+            except ImportError:
+                pass
+            assert transport.save_pickle("plain.pkl", large_df), "Failed to save pickle"
+        finally:
+            transport_module.ZSTANDARD_AVAILABLE = zstd_available
+        with open(Path(temp_dir) / "plain.pkl", 'rb') as f:
+            assert f.read(len(transport_module._OOB_PICKLE_MAGIC)) == transport_module._OOB_PICKLE_MAGIC, \
+                "Large frame should use the out-of-band layout"
+        pd.testing.assert_frame_equal(transport.load_pickle("plain.pkl"), large_df)
+        
+        # Compressed layout (zstandard is optional)
+        if zstd_available:
+            compressed = LocalTransport(temp_dir, compress_pickles=True)
+            assert compressed.save_pickle("compressed.pkl", large_df), "Failed to save compressed pickle"
+            with open(Path(temp_dir) / "compressed.pkl", 'rb') as f:
+                assert f.read(4) == transport_module._ZSTD_FRAME_MAGIC, "Pickle should be zstd compressed"
+            pd.testing.assert_frame_equal(transport.load_pickle("compressed.pkl"), large_df)
+        
+        print("✅ Pickle format tests passed!")
+
+def test_local_transport_caches():
+    """Test that the exists() and get_info() caches follow writes"""
+    print("🔍 Testing Local Transport Caches...")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        transport = LocalTransport(temp_dir)
+        
+        # A cached negative exists() result is cleared by a save
+        assert not transport.exists("cache/new.txt"), "File should not exist yet"
+        assert transport.save_text("cache/new.txt", "data"), "Failed to save text"
+        assert transport.exists("cache/new.txt"), "Save should clear the negative exists() entry"
+        
+        # get_info reflects a write made after it was cached
+        files_before = transport.get_info()["total_files"]
+        assert transport.save_json("cache/nested/new.json", {"value": 1}), "Failed to save JSON"
+        info = transport.get_info()
+        assert info["total_files"] == files_before + 1, "get_info should count the new file"
+        assert "cache/nested/new.json" in [f["key"] for f in info["files"]], "get_info should list the new file"
+        
+        print("✅ Local transport cache tests passed!")
+
 def test_s3_transport():
     """Test S3 transport functionality if configured"""
     
@@ -185,6 +266,13 @@ def test_transport_factories():
     opt_transport = create_optimization_transport()
     assert opt_transport is not None, "Optimization transport should be created"
     
+    # Factories reuse transports until the cache is cleared
+    assert create_cache_transport() is cache_transport, "Cache transport should be reused"
+    if isinstance(opt_transport, LocalTransport):
+        assert create_log_transport() is opt_transport, "Kinds sharing a directory should share a transport"
+    clear_transport_cache()
+    assert create_cache_transport() is not cache_transport, "Cache transport should be rebuilt after clearing"
+    
     print("✅ Transport factory tests passed!")
 
 def main():
@@ -194,6 +282,8 @@ def main():
     
     try:
         test_local_transport()
+        test_pickle_formats()
+        test_local_transport_caches()
         test_s3_transport()
         test_data_cache()
         test_transport_factories()